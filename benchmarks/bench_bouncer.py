@@ -0,0 +1,260 @@
+"""
+Benchmark suite for bouncer.py using synthetic Ableton style projects.
+
+Generates project trees with a configurable number of takes for every StemTypes prefix, then times
+get_latest_stems_print, build_stems_index, copy_Master_to_ShowcaseDir, generate_POST and main end-to-end.
+Everything runs offline and headless, the tkinter prompts are replaced with stubs that fail loudly if reached.
+The results are stored as json so runs can be compared with --compare.
+
+Usage:
+    python benchmarks/bench_bouncer.py --takes 50 --seconds 30 --sample-rate 48000 --bit-depth 24
+    python benchmarks/bench_bouncer.py --compare results/old.json results/new.json
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import statistics
+import struct
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import bouncer
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_IEEE_FLOAT = 3
+
+# Write a .wav file holding a sine tone, 32 bit depth is written as IEEE float like Ableton's 32-bit prints
+def write_wav(path, seconds: float, sample_rate: int = 44100, bit_depth: int = 24, channels: int = 2,
+              frequency: float = 220.0):
+    # One period of the tone is rendered and repeated, so generating long files stays cheap
+    period_frames = max(1, round(sample_rate / frequency))
+    samples = [0.5 * math.sin(2 * math.pi * frame / period_frames) for frame in range(period_frames)]
+    if bit_depth == 32:
+        frames = b"".join(struct.pack("<f", sample) * channels for sample in samples)
+        format_tag = WAVE_FORMAT_IEEE_FLOAT
+    else:
+        scale = 2 ** (bit_depth - 1) - 1
+        sample_width = bit_depth // 8
+        frames = b"".join(int(sample * scale).to_bytes(sample_width, "little", signed=bit_depth > 8) * channels
+                          for sample in samples)
+        format_tag = WAVE_FORMAT_PCM
+
+    block_align = channels * bit_depth // 8
+    total_frames = int(seconds * sample_rate)
+    data_size = total_frames * block_align
+    with open(path, "wb") as wav_file:
+        wav_file.write(b"RIFF" + struct.pack("<I", 36 + data_size) + b"WAVE")
+        wav_file.write(b"fmt " + struct.pack("<IHHIIHH", 16, format_tag, channels, sample_rate,
+                                             sample_rate * block_align, block_align, bit_depth))
+        wav_file.write(b"data" + struct.pack("<I", data_size))
+        whole_periods, remainder = divmod(total_frames, period_frames)
+        chunk = frames * max(1, 65536 // len(frames))
+        chunk_periods = len(chunk) // len(frames)
+        for _ in range(whole_periods // chunk_periods):
+            wav_file.write(chunk)
+        wav_file.write(frames * (whole_periods % chunk_periods))
+        wav_file.write(frames[:remainder * block_align])
+
+# Create a synthetic project with a complete config.ini and takes of every stem print in its Consolidate folder
+def make_project(root, name: str, showcase_dir, takes: int = 5, seconds: float = 10.0, sample_rate: int = 44100,
+                 bit_depth: int = 24, channels: int = 2, stem_prefixes: list = None):
+    project_dir = os.path.join(root, name)
+    consolidate_dir = os.path.join(project_dir, bouncer.CONSOLIDATE_PATH)
+    os.makedirs(consolidate_dir, exist_ok=True)
+    stem_prefixes = stem_prefixes or bouncer.get_stem_prefixes()
+
+    # Only the latest take of each stem is full length, the older takes just need to exist for the directory scans
+    for prefix in stem_prefixes:
+        for take in range(takes):
+            take_path = os.path.join(consolidate_dir, f"{prefix} {take:04}.wav")
+            write_wav(take_path, seconds if take == takes - 1 else 0.01, sample_rate, bit_depth, channels)
+            os.utime(take_path, ns=(take * 1_000_000_000, take * 1_000_000_000))
+
+    config = bouncer.ProjectConfig.from_defaults(os.path.join(project_dir, bouncer.CONFIGFILE_NAME))
+    config.song_id = f"01012024_{name}_BM"
+    config.sample_rate = sample_rate
+    config.song_name = f"Benchmark {name}"
+    config.artist = "Bouncer Bench"
+    config.bpm = "120"
+    config.key = "F minor"
+    config.time_signature = "4/4"
+    config.genre_abbreviation = "BM"
+    config.custom_comment = False
+    config.showcase_dir = showcase_dir
+    config.source_dir = project_dir
+    config.alp_dir = project_dir
+    config.stems_dir = "N/A"
+    config.save()
+    return project_dir
+
+# Replace the tkinter prompts so a benchmark can never hang waiting for a dialog
+def stub_prompts():
+    def fail(*args, **kwargs):
+        raise RuntimeError("A tkinter prompt was opened during the benchmark")
+    bouncer.select_directory = fail
+    bouncer.custom_comments_ui = fail
+
+# Run func repeat times and return the timing statistics in seconds
+def time_it(func, repeat: int, setup=None) -> dict:
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start_time = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start_time)
+    return {"min": min(timings), "median": statistics.median(timings), "max": max(timings), "runs": timings}
+
+def encoder_available() -> bool:
+    try:
+        from pydub.utils import get_encoder_name
+    except ImportError:
+        return False
+    return shutil.which(get_encoder_name()) is not None
+
+def run_benchmarks(args) -> dict:
+    stub_prompts()
+    results = {}
+    work_dir = tempfile.mkdtemp(prefix="bouncer-bench-")
+    try:
+        showcase_dir = os.path.join(work_dir, "showcase")
+        os.makedirs(showcase_dir)
+        print(f"Generating synthetic project in {work_dir}")
+        generate_start = time.perf_counter()
+        project_dir = make_project(work_dir, "bench", showcase_dir, takes=args.takes, seconds=args.seconds,
+                                   sample_rate=args.sample_rate, bit_depth=args.bit_depth, channels=args.channels)
+        print(f"Generated in {time.perf_counter() - generate_start:.2f}s")
+        config = bouncer.ProjectConfig.load(os.path.join(project_dir, bouncer.CONFIGFILE_NAME))
+        prefixes = bouncer.get_stem_prefixes()
+
+        with open(os.devnull, "w") as devnull:
+            stdout = sys.stdout
+            sys.stdout = devnull
+            try:
+                results["get_latest_stems_print (every prefix)"] = time_it(
+                    lambda: [bouncer.get_latest_stems_print(project_dir, prefix, alp_dir_flag=True) for prefix in prefixes],
+                    args.repeat)
+                results["build_stems_index"] = time_it(
+                    lambda: bouncer.build_stems_index(project_dir, prefixes, alp_dir_flag=True), args.repeat)
+                master_print = bouncer.get_latest_stems_print(project_dir, alp_dir_flag=True)
+                results["probe_wav (master)"] = time_it(lambda: bouncer.probe_wav(master_print), args.repeat)
+                try:
+                    import numpy # noqa: F401
+                    results["analyse_wav (master)"] = time_it(lambda: bouncer.analyse_wav(master_print), args.repeat)
+                except ImportError:
+                    results["analyse_wav (master)"] = "numpy is not installed"
+
+                if not encoder_available():
+                    results["skipped"] = "no audio encoder found, the encoding benchmarks were not run"
+                    return results
+
+                stems_index = bouncer.build_stems_index(project_dir, prefixes, alp_dir_flag=True)
+                results["copy_Master_to_ShowcaseDir"] = time_it(
+                    lambda: bouncer.copy_Master_to_ShowcaseDir(
+                        stems_index["MASTER PRINT"], showcase_dir, project_dir, config.song_id, config.version,
+                        config.artist, config.song_name, config.bpm, config.key, config.time_signature,
+                        non_standard_time_signature_flag=False, save_master_editions_flag=False,
+                        streaming_export_flag=not args.no_streaming, interactive=False,
+                        encoder_backend=args.encoder_backend),
+                    args.repeat)
+
+                release_note = bouncer.create_release_note(project_dir, config, interactive=False, comments="Benchmark")
+                results["generate_POST"] = time_it(
+                    lambda: bouncer.generate_POST(project_dir, project_dir, release_note, config,
+                                                  alp_dir_flag=True, export_workers=args.export_workers,
+                                                  streaming_export=not args.no_streaming, stems_index=stems_index,
+                                                  encoder_backend=args.encoder_backend),
+                    args.repeat)
+
+                overrides = {"incrementalCache": "false", "streamingExport": str(not args.no_streaming).lower(),
+                             "encoderBackend": args.encoder_backend}
+                results["main (cold)"] = time_it(
+                    lambda: bouncer.main(project_dir, interactive=False, export_workers=args.export_workers,
+                                         option_overrides=overrides, comments="Benchmark"),
+                    args.repeat)
+                overrides = dict(overrides, incrementalCache="true")
+                bouncer.main(project_dir, interactive=False, export_workers=args.export_workers,
+                             option_overrides=overrides, comments="Benchmark")
+                results["main (warm cache)"] = time_it(
+                    lambda: bouncer.main(project_dir, interactive=False, export_workers=args.export_workers,
+                                         option_overrides=overrides, comments="Benchmark"),
+                    args.repeat)
+            finally:
+                sys.stdout = stdout
+    finally:
+        if args.keep:
+            print(f"Kept the synthetic project in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+# Print the median time of every benchmark in two result files side by side
+def compare(old_path, new_path):
+    with open(old_path) as old_file, open(new_path) as new_file:
+        old, new = json.load(old_file), json.load(new_file)
+    names = [name for name in new["benchmarks"] if isinstance(new["benchmarks"][name], dict)]
+    width = max(len(name) for name in names + ["Benchmark"])
+    print(f"{'Benchmark':<{width}}  {'Old (s)':>10}  {'New (s)':>10}  {'Change':>8}")
+    for name in names:
+        new_median = new["benchmarks"][name]["median"]
+        old_result = old["benchmarks"].get(name)
+        if not isinstance(old_result, dict):
+            print(f"{name:<{width}}  {'-':>10}  {new_median:>10.4f}  {'-':>8}")
+            continue
+        change = (new_median - old_result["median"]) / old_result["median"] * 100 if old_result["median"] else 0.0
+        print(f"{name:<{width}}  {old_result['median']:>10.4f}  {new_median:>10.4f}  {change:>+7.1f}%")
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Benchmark bouncer.py on synthetic Ableton style projects")
+    parser.add_argument("--takes", type=int, default=20, help="takes per stem print prefix")
+    parser.add_argument("--seconds", type=float, default=10.0, help="length of the latest take of every stem")
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    parser.add_argument("--bit-depth", type=int, default=24, choices=(16, 24, 32))
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each benchmark")
+    parser.add_argument("--export-workers", type=int, default=0)
+    parser.add_argument("--no-streaming", action="store_true", help="benchmark the pydub export path")
+    parser.add_argument("--encoder-backend", default="ffmpeg", choices=bouncer.ENCODER_BACKENDS,
+                        help="encode the mp3s with ffmpeg processes or in process with lameenc")
+    parser.add_argument("--keep", action="store_true", help="keep the synthetic project after the run")
+    parser.add_argument("--output", help="path of the json results (default: results/<date>-<host>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two json result files")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    args.encoder_backend = bouncer.get_encoder_backend(args.encoder_backend)
+    benchmarks = run_benchmarks(args)
+    results = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "parameters": {name: value for name, value in vars(args).items() if name not in ("output", "compare")},
+        "benchmarks": benchmarks,
+    }
+    output_path = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{platform.node()}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+
+    for name, result in benchmarks.items():
+        if isinstance(result, dict):
+            print(f"{name:<40} median {result['median']:.4f}s  min {result['min']:.4f}s")
+        else:
+            print(f"{name}: {result}")
+    print(f"Results saved to {output_path}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,14 +4,19 @@ from configparser import ConfigParser
 import os
 import io
 import re
+import json
 import sys
-import shutil
 from enum import Enum
+from dataclasses import dataclass, field
 import time
-from pydub import AudioSegment
+import argparse
+import contextlib
+import threading
+import struct
+import mmap
 from datetime import datetime
-import tkinter as tk
-from tkinter import filedialog
+# The heavy dependencies (pydub, tkinter, multiprocessing, subprocess, ctypes) and the modules only some commands need
+# (hashlib, shutil, tempfile, platform, select) are imported where they are used, so short runs start up quickly
 
 # Declare Variable Constants
 CONFIGFILE_NAME = "config.ini"
@@ -19,6 +24,23 @@ SCRIPT_DIR = os.path.dirname(os.path.realpath(sys.argv[0]))
 SOURCE_DIR = os.path.dirname(SCRIPT_DIR)
 CONSOLIDATE_PATH = "Samples/Processed/Consolidate"
 RECORDINGS_PATH = "Samples/Recorded"
+STREAM_CHUNK_SIZE = 1024 * 1024 # Size in bytes of each block of the .wav file piped to the encoder when streaming
+BOUNCE_MANIFEST_NAME = ".bouncer_manifest.json"
+BOUNCE_JOURNAL_NAME = ".bouncer_journal.json" # Phases finished by an interrupted bounce, removed once a bounce completes
+PROJECT_INDEX_NAME = ".bouncer_projects.json" # Kept in the projects parent folder to assign day IDs
+CATALOG_NAME = ".bouncer_catalog.sqlite" # Release catalog kept in the projects parent folder unless catalogPath is set
+OBJECT_STORE_DIR = ".objects" # Content addressed store inside the POST folder that every POST entry links into
+FICLONE = 0x40049409 # Linux ioctl that makes a copy on write clone of a file on btrfs, XFS and similar filesystems
+SHOWCASE_MANIFEST_NAME = ".bouncer_showcase.json" # Kept in the showcase folder to find the published files of a song
+SHOWCASE_FILENAME_PATTERN = re.compile(r"^(?P<song_id>.+?) v(?P<version>\d+) \[\[") # songID vN [[Artist] - [Song]] ...
+LOCK_TIMEOUT_SECONDS = 30.0 # Seconds to wait for a lock file before giving up
+LOCK_STALE_SECONDS = 120.0 # A lock file older than this was left behind by a crashed run and is removed
+SILENCE_WINDOW_SECONDS = 0.05 # Length of the windows whose RMS level is compared to the silenceThreshold
+MIX_GROUP_CEILING_DB = -1.0 # A mix group whose summed stems peak above this is turned down to peak here instead
+WAVEFORM_ZOOM_LEVELS = (256, 1024, 4096) # Samples per pixel of each zoom level in the waveform peaks sidecar
+PACKAGE_STORED_EXTENSIONS = {".mp3", ".ogg", ".flac", ".wav"} # Added to the POST archive without compressing them again
+WATCH_POLL_INTERVAL = 1.0 # Seconds between checks of the watched folders
+WATCH_DEBOUNCE_SECONDS = 2.0 # Seconds a new print must stay unchanged before it is bounced
 
 DEFAULT_useSourceDirName = True
 DEFAULT_sampleRate = 44100
@@ -28,7 +50,9 @@ DEFAULT_CONFIG_MODEL = {
         'version': '0',
         'songID': '',
         'Current Date of Version':  str(datetime.today().strftime('%d-%m-%Y')),
-        'Sample Rate': ''
+        'Sample Rate': '',
+        'Bit Depth': 'N/A',
+        'Channels': 'N/A'
     },
     'Song Details': {
         'Song Name': '',
@@ -44,13 +68,28 @@ DEFAULT_CONFIG_MODEL = {
         'saveMasterEditions': 'false',
         'abletonAsDAW': 'true',
         'abletonConsolidateFlag': 'true',
-        'customComment': 'true'
+        'customComment': 'true',
+        'exportWorkers': '0',
+        'streamingExport': 'true',
+        'extraStemPrints': 'none',
+        'incrementalCache': 'true',
+        'timingReport': 'true',
+        'outputProfiles': 'mp3@192k',
+        'audioAnalysis': 'true',
+        'objectStore': 'true',
+        'waveformPeaks': 'true',
+        'encoderBackend': 'ffmpeg',
+        'releaseCatalog': 'true',
+        'silenceThreshold': '-70',
+        'packagePOST': 'false',
+        'mixGroups': 'none'
     },
     'Directories': {
         'showcaseDir': '',
         'sourceDir': '',
         'alpDir': '',
         'stemsDir': '',
+        'catalogPath': '',
     }
 }
 class StemTypes(Enum):
@@ -66,9 +105,206 @@ class StemTypes(Enum):
     SYNTHS = "SYNTHS PRINT"
     SAMPLE = "SAMPLE PRINT"
 
+# Helper function to write a text file atomically, so a crash never leaves a half written file behind
+def atomic_write_text(path, text: str):
+    import tempfile
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                                  prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w") as temp_file:
+            temp_file.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+# Helper function for the sha256 of a file, read a block at a time into one reused buffer
+def hash_file(path) -> str:
+    import hashlib
+    digest = hashlib.sha256()
+    buffer = bytearray(STREAM_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as hashed_file:
+        for size in iter(lambda: hashed_file.readinto(buffer), 0):
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+# Helper function that holds a lock file while a file shared between bouncer runs is read and rewritten
+@contextlib.contextmanager
+def file_lock(path, timeout: float = LOCK_TIMEOUT_SECONDS):
+    """
+    Creates path + '.lock' exclusively for the duration of the with block, waiting up to timeout seconds for other runs.
+    Works the same on every platform and on network drives, unlike fcntl or msvcrt locks.
+    """
+    lock_path = path + ".lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > LOCK_STALE_SECONDS:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue # The lock was released while it was checked
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {lock_path}, remove it if no other bouncer is running")
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+
+# Helper function that runs func on its own background thread and returns a Future for its result
+def run_in_background(func, *args, name: str = "bouncer", **kwargs):
+    from concurrent.futures import ThreadPoolExecutor
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+    future = executor.submit(func, *args, **kwargs)
+    executor.shutdown(wait=False)
+    return future
+
+# Helper function to declare a typed property of ProjectConfig that reads and writes a single config.ini entry
+def config_property(section: str, key: str, kind: type = str, fallback=None):
+    def getter(self):
+        # Command line overrides take precedence over the config.ini but are never written back to it
+        value = self.overrides.get((section, key.lower()))
+        if value is None:
+            value = self.parser.get(section, key, fallback=None)
+        if value is None:
+            return fallback
+        if kind is bool:
+            if value.lower() not in ConfigParser.BOOLEAN_STATES:
+                raise ValueError(f"Not a boolean for '{key}' in section '[{section}]': {value}")
+            return ConfigParser.BOOLEAN_STATES[value.lower()]
+        if kind is int:
+            return int(value)
+        return value
+
+    def setter(self, value):
+        self.set(section, key, str(value).lower() if kind is bool else str(value))
+
+    return property(getter, setter)
+
+# In memory model of a project's config.ini
+@dataclass(slots=True)
+class ProjectConfig:
+    """
+    Holds a project's config.ini in memory with typed access to every entry.
+    It is loaded once, validated once with check_config, passed through the bouncer process and
+    written back with a single atomic save at the end.
+    """
+    path: str
+    parser: ConfigParser = field(default_factory=ConfigParser)
+    dirty: bool = False
+    overrides: dict = field(default_factory=dict) # (section, key) -> value used for this run only
+
+    @classmethod
+    def load(cls, path):
+        """Reads the config.ini at path."""
+        config = cls(path)
+        with open(path) as configfile:
+            config.parser.read_file(configfile)
+        return config
+
+    @classmethod
+    def from_defaults(cls, path, defaults: dict = DEFAULT_CONFIG_MODEL):
+        """Creates a new, unsaved config filled in with the default values."""
+        config = cls(path, dirty=True)
+        for section, options in defaults.items():
+            config.parser.add_section(section)
+            for key, value in options.items():
+                config.parser.set(section, key, str(value))
+        return config
+
+    def set(self, section: str, key: str, value: str):
+        if not self.parser.has_section(section):
+            self.parser.add_section(section)
+        if self.parser.get(section, key, fallback=None) != value:
+            self.parser.set(section, key, value)
+            self.dirty = True
+
+    def override(self, section: str, key: str, value: str):
+        """Overrides an entry for this run only, without changing the config.ini."""
+        self.overrides[(section, key.lower())] = str(value)
+
+    def has_section(self, section: str) -> bool:
+        return self.parser.has_section(section)
+
+    def save(self, force: bool = False):
+        """Writes the config back to disk with a temporary file and rename, only if it has been changed."""
+        if not (self.dirty or force):
+            return
+        text = io.StringIO()
+        self.parser.write(text)
+        atomic_write_text(self.path, text.getvalue())
+        self.dirty = False
+
+    # Metadata
+    version = config_property("Metadata", "Version", int, fallback=0)
+    song_id = config_property("Metadata", "songID", fallback="")
+    current_date = config_property("Metadata", "Current Date of Version", fallback="")
+    sample_rate = config_property("Metadata", "Sample Rate", fallback="")
+    bit_depth = config_property("Metadata", "Bit Depth", fallback="N/A")
+    channels = config_property("Metadata", "Channels", fallback="N/A")
+    # Song Details
+    song_name = config_property("Song Details", "Song Name", fallback="")
+    artist = config_property("Song Details", "Artist", fallback="")
+    bpm = config_property("Song Details", "BPM", fallback="")
+    key = config_property("Song Details", "Key", fallback="")
+    time_signature = config_property("Song Details", "Time Signature", fallback="4/4")
+    duration = config_property("Song Details", "Duration", fallback="N/A")
+    genre_abbreviation = config_property("Song Details", "Genre Abbreviation", fallback="")
+    # Options
+    use_source_dir_names = config_property("Options", "useSourceDirNames", bool, fallback=False)
+    save_master_editions = config_property("Options", "saveMasterEditions", bool, fallback=False)
+    ableton_as_daw = config_property("Options", "abletonAsDAW", bool, fallback=True)
+    ableton_consolidate = config_property("Options", "abletonConsolidateFlag", bool, fallback=True)
+    custom_comment = config_property("Options", "customComment", bool, fallback=True)
+    export_workers = config_property("Options", "exportWorkers", int, fallback=0)
+    streaming_export = config_property("Options", "streamingExport", bool, fallback=True)
+    extra_stem_prints = config_property("Options", "extraStemPrints", fallback="none")
+    incremental_cache = config_property("Options", "incrementalCache", bool, fallback=True)
+    timing_report = config_property("Options", "timingReport", bool, fallback=True)
+    output_profiles = config_property("Options", "outputProfiles", fallback="mp3@192k")
+    audio_analysis = config_property("Options", "audioAnalysis", bool, fallback=True)
+    object_store = config_property("Options", "objectStore", bool, fallback=True)
+    waveform_peaks = config_property("Options", "waveformPeaks", bool, fallback=True)
+    encoder_backend = config_property("Options", "encoderBackend", fallback="ffmpeg")
+    release_catalog = config_property("Options", "releaseCatalog", bool, fallback=True)
+    silence_threshold = config_property("Options", "silenceThreshold", fallback="-70")
+    package_post = config_property("Options", "packagePOST", bool, fallback=False)
+    mix_groups = config_property("Options", "mixGroups", fallback="none")
+    # Directories
+    showcase_dir = config_property("Directories", "showcaseDir", fallback="")
+    source_dir = config_property("Directories", "sourceDir", fallback="")
+    alp_dir = config_property("Directories", "alpDir", fallback="")
+    stems_dir = config_property("Directories", "stemsDir", fallback="")
+    catalog_path = config_property("Directories", "catalogPath", fallback="")
+
+    @property
+    def non_standard_time_signature(self) -> bool:
+        return self.time_signature != "4/4"
+
+    @property
+    def prints_directory(self) -> str:
+        """The ALP directory when Ableton is the DAW, otherwise the Stems directory."""
+        return self.alp_dir if self.ableton_as_daw else self.stems_dir
+
 # Select the current Directory using TKinter and add that to the config.ini file
-def select_directory(directoryName: str = "ALP"):
+def select_directory(directoryName: str = "ALP", interactive: bool = True):
     """Open a dialog for the user to select a directory and return its filepath."""
+    if not interactive:
+        print(f"No valid {directoryName} Directory is set in config.ini and prompts are disabled. Please set it and rerun the script")
+        raise SystemExit(1)
+    import tkinter as tk
+    from tkinter import filedialog
+
     # Create a hidden Tkinter root window
     root = tk.Tk()
     root.withdraw()  # Hide the root window
@@ -83,8 +319,13 @@ def select_directory(directoryName: str = "ALP"):
         return selected_dir
     else:
         print("No directory selected. Please Rerun the script to try again")
+        stop_bouncer(interactive)
+
+# Stop the bouncer process, waiting for the user to read the output first when running interactively
+def stop_bouncer(interactive: bool = True):
+    if interactive:
         EXIT = input("Press Enter to exit script")
-        raise SystemExit(1)
+    raise SystemExit(1)
 
 # TKinter UI for the user to add their custom comment for the current release to
 def custom_comments_ui():
@@ -92,6 +333,8 @@ def custom_comments_ui():
     Creates the tkinter UI for inputting comments.
     Returns the entered comments after the UI is closed.
     """
+    import tkinter as tk
+
     def on_save():
         """Handle the save button click."""
         nonlocal comments
@@ -121,10 +364,11 @@ def custom_comments_ui():
 
     return comments
 # Extract from source directory name key information
-def parse_sourceDirName(source_dir_path):
+def parse_sourceDirName(source_dir_path, config: ProjectConfig, interactive: bool = True):
     """
     Extracts song details from the source directory name in the format:
     "SongID" "[Song Artist - Song Name]" "Song BPM"BPM "Song Key"
+    The details are filled into config, which is left for the caller to save.
     """
     # Regex expression to match the pattern
     name = os.path.basename(source_dir_path)
@@ -137,22 +381,8 @@ def parse_sourceDirName(source_dir_path):
         print(f"Source Directory '{name}' does not match the expected pattern: SongID [Song Artist - Song Name] Song BPM Song Key")
         print("Generating default config.ini file")
         # prompt user to select showcaseDir
-        new_showcase_dir = select_directory('Showcase')
-        # Create the defualt config.ini file with all values (except ones above) defaulted to blank
-        config = configparser.ConfigParser()
-        for section, options in DEFAULT_CONFIG_MODEL.items():
-            config.add_section(section)
-            for key, value in options.items():
-                config.set(section, key, str(value))
-
-        # Set the default showcase directory to the user selected one
-        config.set("Directories", "showcaseDir", str(new_showcase_dir))
-        config_path = os.path.join(source_dir_path, CONFIGFILE_NAME)
-        # Change
-        with open(config_path, 'w') as configfile:
-            config.write(configfile)
-        print(
-            f"Default config.ini file has been created at {config_path}.")
+        config.showcase_dir = select_directory('Showcase', interactive)
+        print(f"Default config.ini file will be created at {config.path}.")
         return False
 
     print("Source Directory name matches expected pattern. Extracting Song Details")
@@ -160,293 +390,2088 @@ def parse_sourceDirName(source_dir_path):
     date = match.group(1)
     day_id = match.group(2)
     genre_abbreviation = match.group(3)
-    song_id= f"{date}_{day_id}_{genre_abbreviation}"
-
-    artist = match.group(4)
-    song_name = match.group(5)
-    bpm = match.group(6)
-    key = match.group(7) + match.group(8)
-
-    # Create the configuration file as it doesn't exist yet
-    print("Creating config file")
-    cfgfile = open(os.path.join(source_dir_path, CONFIGFILE_NAME), "w")
-
-    # Add content to the file
-    Config = configparser.ConfigParser()
-    Config.add_section("Metadata")
-    Config.set("Metadata", "Version", str(0))
-    Config.set("Metadata", "SongID", song_id)
-    Config.set("Metadata", "Current Date of Version", str(datetime.today().strftime('%d-%m-%Y')))
-    Config.set("Metadata", "Sample Rate", str(DEFAULT_sampleRate))
-
-    Config.add_section("Song Details")
+
+    config.version = 0
+    config.song_id = f"{date}_{day_id}_{genre_abbreviation}"
+    config.current_date = datetime.today().strftime('%d-%m-%Y')
+    config.sample_rate = DEFAULT_sampleRate
+
     # Make sure Artists and Song Name is formatted correctly to account for use of Commas
-    Config.set("Song Details", "Artist", artist)
-    Config.set("Song Details", "Song Name", song_name)
-    Config.set("Song Details", "Time Signature", "4/4")
-    Config.set("Song Details", "BPM", bpm)
-    Config.set("Song Details", "Key", key)
-    Config.set("Song Details", "Duration", "N/A")
-    Config.set("Song Details", "Genre Abbreviation", genre_abbreviation)
-
-    Config.add_section("Directories")
-    new_showcase_dir = select_directory("Showcase")
-    Config.set("Directories", "showcaseDir", str(new_showcase_dir))
-
-    Config.write(cfgfile)
-    print(f"Song Details extracted from Source Directory name have been saved to {CONFIGFILE_NAME}")
-    cfgfile.close()
+    config.artist = match.group(4)
+    config.song_name = match.group(5)
+    config.time_signature = "4/4"
+    config.bpm = match.group(6)
+    config.key = match.group(7) + match.group(8)
+    config.duration = "N/A"
+    config.genre_abbreviation = genre_abbreviation
+
+    config.showcase_dir = select_directory("Showcase", interactive)
+    print(f"Song Details extracted from Source Directory name will be saved to {CONFIGFILE_NAME}")
     return True
 
-def createSongID(source_dir, genre_abbreviation: str = " "):
+def createSongID(source_dir, config: ProjectConfig, genre_abbreviation: str = " "):
     """Generate a valid songID based on the source directory's creation date.
     Note that dayID (of the form 01) denotes the unique identifier given to seperate projects in the projects directory that were created on the same day
 
     Args:
         source_dir (str): Path to the source directory.
+        config (ProjectConfig): The project's config, its songID is updated in memory.
         genre_abbreviation (str): Abbreviation for the genre.
 
     Returns:
         str: A unique songID of the form 'DDMMYYYY_dayID-[Genre Abbreviation]'.
     """
-    # Create a ConfigParser object
-    config = configparser.ConfigParser()
-    ini_filepath = os.path.join(source_dir, CONFIGFILE_NAME)
-
-    if not os.path.exists(ini_filepath):
-        raise FileNotFoundError(f"The file {CONFIGFILE_NAME} does not exist.")
-
-    config.read_file(open(ini_filepath))
-
     # Check if 'Song Details' section exists (it should, as per the original script)
-    if 'Song Details' not in config:
+    if not config.has_section('Song Details'):
         raise KeyError(f"No 'Song Details' section found in {CONFIGFILE_NAME}.")
 
-    # Get the creation time of the directory
-    creation_time = os.path.getctime(source_dir)
-    creation_date = datetime.fromtimestamp(creation_time).strftime("%d%m%Y")
-
-    # List directories in the parent folder
-    parent_dir = os.path.dirname(source_dir)
-    all_dirs = [d for d in os.listdir(parent_dir) if os.path.isdir(os.path.join(parent_dir, d))]
-
-    # Filter directories created on the same day
-    day_count = 0
-    for d in all_dirs:
-        dir_path = os.path.join(parent_dir, d)
-        dir_creation_time = os.path.getctime(dir_path)
-        dir_creation_date = datetime.fromtimestamp(dir_creation_time).strftime("%d%m%Y")
-        if dir_creation_date == creation_date:
-            day_count += 1
-        if dir_path == source_dir:
-            break
+    # Look up the creation date and dayID of the directory in the index of its parent folder
+    creation_date, day_count = get_project_day_id(source_dir)
 
     # Generate dayID
     day_id = f"{day_count:02}"
 
     # Combine to create songID
     song_id = f"{creation_date}_{day_id}_[{genre_abbreviation}]"
-    config["Metadata"]["songID"] = song_id
-
-    # Write the updated config back to the file
-    with open(ini_filepath, 'w') as configfile:
-        config.write(configfile)
+    config.song_id = song_id
     print(f"Song Id updated to {song_id} in {CONFIGFILE_NAME}")
     return song_id
 
 
-# Create a helper function that appends one to the config file
-def increment_version(source_dir):
+# Helper function to get the creation date and dayID of a project from the index kept in its parent folder
+def get_project_day_id(source_dir) -> tuple:
     """
-    Increments the version number in the provided .ini file.
-    If the Version field doesn't exist, it initializes it to 1.
+    Returns (creation date as DDMMYYYY, dayID) for source_dir.
+    The first call in a parent folder indexes every project in it once, ordered by creation time and then by name,
+    afterwards each new project is given the next dayID of its creation date, so the IDs never change between runs.
     """
-    # Create a ConfigParser object
-    config = configparser.ConfigParser()
-    ini_filepath = os.path.join(source_dir, CONFIGFILE_NAME)
-
-    # Read the .ini file
-    if not os.path.exists(ini_filepath):
-        raise FileNotFoundError(f"The file {CONFIGFILE_NAME} does not exist.")
+    source_dir = os.path.abspath(source_dir)
+    parent_dir, project_name = os.path.split(source_dir)
+    index_path = os.path.join(parent_dir, PROJECT_INDEX_NAME)
+
+    with file_lock(index_path):
+        index = None
+        if os.path.exists(index_path):
+            try:
+                with open(index_path) as index_file:
+                    index = json.load(index_file)
+            except (OSError, ValueError):
+                print(f"Could not read {PROJECT_INDEX_NAME}, indexing the projects in {parent_dir} again")
+        if index is not None and project_name in index["projects"]:
+            entry = index["projects"][project_name]
+            return entry["date"], entry["day_id"]
+
+        if index is None:
+            # Seed the index in creation order, directories with the same creation time are ordered by name
+            index = {"projects": {}, "day_counts": {}}
+            with os.scandir(parent_dir) as entries:
+                project_dirs = sorted((entry.stat().st_ctime, entry.name) for entry in entries
+                                      if entry.is_dir() and not entry.name.startswith("."))
+            if project_name not in {name for _, name in project_dirs}:
+                project_dirs.append((os.path.getctime(source_dir), project_name))
+            for creation_time, name in project_dirs:
+                creation_date = datetime.fromtimestamp(creation_time).strftime("%d%m%Y")
+                index["day_counts"][creation_date] = index["day_counts"].get(creation_date, 0) + 1
+                index["projects"][name] = {"date": creation_date, "day_id": index["day_counts"][creation_date]}
+        else:
+            # A new project only needs its own creation time
+            creation_date = datetime.fromtimestamp(os.path.getctime(source_dir)).strftime("%d%m%Y")
+            index["day_counts"][creation_date] = index["day_counts"].get(creation_date, 0) + 1
+            index["projects"][project_name] = {"date": creation_date, "day_id": index["day_counts"][creation_date]}
+        atomic_write_text(index_path, json.dumps(index, indent=1, sort_keys=True))
 
-    config.read_file(open(ini_filepath))
+    entry = index["projects"][project_name]
+    return entry["date"], entry["day_id"]
 
+# Create a helper function that appends one to the config file
+def increment_version(config: ProjectConfig, catalog=None):
+    """
+    Increments the version number in the project's config.
+    If the Version field doesn't exist, it initializes it to 1.
+    The version that has just been bounced is marked as released in the ReleaseCatalog if one is given.
+    """
     # Check if 'Song Details' section exists (it should, as per the original script)
-    if 'Song Details' not in config:
+    if not config.has_section('Song Details'):
         raise KeyError(f"No 'Song Details' section found in {CONFIGFILE_NAME}.")
+    if catalog:
+        catalog.record_version(os.path.dirname(config.path), config, released=True)
 
-    # Get the current version, or set it to 0 if it doesn't exist
-    current_version = config['Metadata'].getint('Version', fallback=0)
-
-    # Increment the version
-    new_version = current_version + 1
-    config['Metadata']['Version'] = str(new_version)
-
-    # Write the updated config back to the file
-    with open(ini_filepath, 'w') as configfile:
-        config.write(configfile)
+    # Get the current version (0 if it doesn't exist) and increment it
+    new_version = config.version + 1
+    config.version = new_version
 
     print(f"Version updated to Version {new_version} in {CONFIGFILE_NAME}")
+    return new_version
 
 # Helper function to format any incoming data from the config files into strings that can be used in filenames
 def format_for_filename(data: str, artistsFlag: bool = False) -> str:
     return (re.sub(r'[,\\/*?:"<>|]', '-', data) if not artistsFlag
             else data.replace('feat:', 'x').replace(',', ' x').strip())
 
+# Helper function to find the folder that the stem prints are bounced into
+def get_stems_folder(directory, consolidate_sel: bool = True, alp_dir_flag: bool = False):
+    # If consolidate chosen, then files taken from the consolidate path else the recorded paths is chosen
+    if alp_dir_flag:
+        if consolidate_sel:
+            return os.path.join(directory, CONSOLIDATE_PATH)
+        return os.path.join(directory, RECORDINGS_PATH)
+    return directory
+
+# Helper function to get every stem print prefix, the StemTypes plus any extra ones listed in the config.ini
+def get_stem_prefixes(extra_stem_prints: str = "none") -> list:
+    """
+    Returns the StemTypes values followed by the comma separated prefixes in the extraStemPrints option.
+    """
+    prefixes = [type.value for type in StemTypes]
+    for prefix in extra_stem_prints.split(","):
+        prefix = prefix.strip()
+        if prefix and prefix.lower() != "none" and prefix not in prefixes:
+            prefixes.append(prefix)
+    return prefixes
+
+# The format of a .wav print, as read from its header by probe_wav
+@dataclass(frozen=True, slots=True)
+class WavInfo:
+    sample_rate: int
+    channels: int
+    bit_depth: int
+    format_tag: int # WAVE_FORMAT_PCM (1) or WAVE_FORMAT_IEEE_FLOAT (3), resolved from the sub format of EXTENSIBLE files
+    data_offset: int # Byte offset of the first sample
+    data_size: int # Bytes of audio data
+
+    @property
+    def block_align(self) -> int:
+        return self.channels * ((self.bit_depth + 7) // 8)
+
+    @property
+    def frame_count(self) -> int:
+        return self.data_size // self.block_align if self.block_align else 0
+
+    @property
+    def duration(self) -> float:
+        return self.frame_count / self.sample_rate if self.sample_rate else 0.0
+
+WAVE_FORMAT_IEEE_FLOAT = 3
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+RF64_SIZE_PLACEHOLDER = 0xFFFFFFFF # The 32 bit chunk size of an RF64 file, the real size is in the ds64 chunk
+
+# Helper function that reads the format and length of a .wav file from its header without decoding any audio
+def probe_wav(wav_path) -> WavInfo:
+    """
+    Walks the RIFF chunks of wav_path up to its data chunk through a memory map, so only the header pages are read.
+    Handles plain RIFF, WAVE_FORMAT_EXTENSIBLE and RF64 (files over 4 GB) prints.
+    Raises ValueError if the file is not a wav file.
+    """
+    with open(wav_path, "rb") as wav_file:
+        file_size = os.fstat(wav_file.fileno()).st_size
+        if file_size < 12:
+            raise ValueError(f"{os.path.basename(wav_path)} is too short to be a wav file")
+        try:
+            with mmap.mmap(wav_file.fileno(), 0, access=mmap.ACCESS_READ) as header:
+                riff_id, _, wave_id = struct.unpack_from("<4sI4s", header, 0)
+                if riff_id not in (b"RIFF", b"RF64") or wave_id != b"WAVE":
+                    raise ValueError(f"{os.path.basename(wav_path)} is not a RIFF/WAVE file")
+
+                fmt = None
+                rf64_data_size = None
+                offset = 12
+                while offset + 8 <= file_size:
+                    chunk_id, chunk_size = struct.unpack_from("<4sI", header, offset)
+                    body = offset + 8
+                    if chunk_id == b"ds64":
+                        _, rf64_data_size = struct.unpack_from("<QQ", header, body)
+                    elif chunk_id == b"fmt ":
+                        format_tag, channels, sample_rate, _, _, bit_depth = struct.unpack_from("<HHIIHH", header, body)
+                        if format_tag == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                            # The real format is the first two bytes of the sub format GUID
+                            format_tag, = struct.unpack_from("<H", header, body + 24)
+                        fmt = (format_tag, channels, sample_rate, bit_depth)
+                    elif chunk_id == b"data":
+                        if fmt is None:
+                            raise ValueError(f"{os.path.basename(wav_path)} has no fmt chunk before its audio data")
+                        if chunk_size == RF64_SIZE_PLACEHOLDER and rf64_data_size is not None:
+                            chunk_size = rf64_data_size
+                        # A print that is still being written can be shorter than its header says
+                        data_size = min(chunk_size, file_size - body)
+                        format_tag, channels, sample_rate, bit_depth = fmt
+                        return WavInfo(sample_rate, channels, bit_depth, format_tag, body, data_size)
+                    offset = body + chunk_size + (chunk_size & 1) # Chunks are padded to an even size
+        except struct.error as error:
+            # A chunk header runs past the end of a print that is cut short, e.g. one that is still being written
+            raise ValueError(f"{os.path.basename(wav_path)} has a truncated header") from error
+    raise ValueError(f"{os.path.basename(wav_path)} has no audio data")
+
+# Helper function that converts raw little endian sample bytes of a print into float32 samples scaled to -1.0 to 1.0
+def decode_wav_samples(raw, info: WavInfo):
+    """
+    raw holds whole frames of audio data as bytes or a numpy uint8 array, such as a slice of a memmap.
+    Returns a float32 numpy array of shape (frames, channels).
+    Handles 8, 16, 24 and 32 bit integer and 32 and 64 bit float prints. Requires numpy.
+    """
+    import numpy as np
+    data = raw if isinstance(raw, np.ndarray) else np.frombuffer(raw, dtype=np.uint8)
+    sample_width = (info.bit_depth + 7) // 8
+    if info.format_tag == WAVE_FORMAT_IEEE_FLOAT and sample_width in (4, 8):
+        samples = data.view(f"<f{sample_width}").astype(np.float32)
+    elif sample_width == 1:
+        # 8 bit wav samples are unsigned, every other integer width is signed
+        samples = (data.astype(np.float32) - 128.0) / 128.0
+    elif sample_width in (2, 4):
+        samples = data.view(f"<i{sample_width}").astype(np.float32) / float(2 ** (8 * sample_width - 1))
+    elif sample_width == 3:
+        # numpy has no 24 bit type, so the bytes are assembled into 32 bit integers
+        block = data.reshape(-1, 3).astype(np.int32)
+        samples = (block[:, 0] | (block[:, 1] << 8) | (block[:, 2] << 16)) << 8 >> 8 # Sign extend the top byte
+        samples = samples.astype(np.float32) / float(2 ** 23)
+    else:
+        raise ValueError(f"Unsupported sample format ({info.bit_depth} bit)")
+    return samples.reshape(-1, info.channels)
+
+# Generator that reads a .wav print block by block through a numpy memmap, shared by every stage that analyses audio
+def iter_wav_blocks(wav_path, block_frames: int = 65536, info: WavInfo = None):
+    """
+    Yields the audio of wav_path as float32 numpy arrays of shape (frames, channels) scaled to -1.0 to 1.0,
+    at most block_frames frames at a time, so only one block of the print is ever held in memory. Requires numpy.
+    """
+    import numpy as np
+    info = info or probe_wav(wav_path)
+    frame_count = info.frame_count
+    if frame_count == 0:
+        return
+    raw = np.memmap(wav_path, dtype=np.uint8, mode="r", offset=info.data_offset,
+                    shape=(frame_count * info.block_align,))
+    for start in range(0, frame_count, block_frames):
+        stop = min(start + block_frames, frame_count)
+        yield decode_wav_samples(raw[start * info.block_align:stop * info.block_align], info)
+
+# Helper function that indexes the latest print of every stem in a single pass over the folder
+def build_stems_index(directory, stem_prefixes: list = None,
+                      consolidate_sel: bool = True, alp_dir_flag: bool = False) -> dict:
+    """
+    Scans the ALP or Stems directory once with os.scandir and maps each stem prefix to the full path of its latest .wav print.
+    Prefixes with no matching print are mapped to None.
+    """
+    stem_prefixes = stem_prefixes if stem_prefixes is not None else get_stem_prefixes()
+    consolidate_folder = get_stems_folder(directory, consolidate_sel, alp_dir_flag)
+
+    latest = {prefix: (None, None) for prefix in stem_prefixes} # prefix -> (modification time, path)
+    with os.scandir(consolidate_folder) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.wav'):
+                continue
+            modified_time = None
+            for prefix in stem_prefixes:
+                if entry.name.startswith(prefix):
+                    # Stat each matching file once, the result is cached on the DirEntry
+                    if modified_time is None:
+                        modified_time = entry.stat().st_mtime
+                    latest_time, _ = latest[prefix]
+                    if latest_time is None or modified_time > latest_time:
+                        latest[prefix] = (modified_time, entry.path)
+
+    return {prefix: path for prefix, (_, path) in latest.items()}
+
 # Helper function to get the latest print of the particular stems
 def get_latest_stems_print(directory, stems_print: str = "MASTER PRINT",
-                           consolidate_sel: bool = True, alp_dir_flag: bool = False):
+                           consolidate_sel: bool = True, alp_dir_flag: bool = False,
+                           stems_index: dict = None):
     """
     Finds the latest .wav file in the Ableton Live Project (ALP) directory or Stems Directory that starts with the string stems_print.
+    If a stems_index from build_stems_index is given the lookup is taken from it instead of scanning the directory.
     Returns the full file path of the latest file.
     """
-    # List all files in the directory, if consolidate chosen, then files taken from the consolidate path else the recorded paths is chosen
-    if alp_dir_flag:
-        if consolidate_sel:
-            consolidate_folder = os.path.join(directory, CONSOLIDATE_PATH)
-        else:
-            consolidate_folder = os.path.join(directory, RECORDINGS_PATH)
-    else:
-        consolidate_folder = directory
+    if stems_index is None or stems_print not in stems_index:
+        stems_index = build_stems_index(directory, [stems_print], consolidate_sel, alp_dir_flag)
+    latest_file = stems_index[stems_print]
 
-    files = [f for f in os.listdir(consolidate_folder) if f.startswith(stems_print) and f.endswith('.wav')]
-
-
-    if not files:
+    if latest_file is None:
         con_record_print_string = "consolidate" if consolidate_sel else "recorded"
         print(f"No files found starting with '{stems_print}' in {con_record_print_string} folder of Ableton Live Project Directory.\n")
         return None
 
-    # Full file paths
-    full_paths = [os.path.join(consolidate_folder, f) for f in files]
-
-    # Get the latest file by creation date (for Linux use `os.stat(f).st_mtime` for modification time)
-    latest_file = max(full_paths, key=os.path.getmtime)
-
     print(f"The latest {stems_print} file: {os.path.basename(latest_file)}")
     return latest_file
 
 
-# Copy the Master Track as an mp3 into a new Song Showcase Directories Folder
+# Collects how long each phase and each stem export of a bounce took
+class BounceReport:
+    """
+    Times each phase of the bouncer process and records the decode/encode statistics of every exported print.
+    The report is written as json next to the release note so runs can be compared across machines.
+    """
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.start_time = time.perf_counter()
+        self.phases = [] # [{"name", "seconds"}] in the order the phases ran
+        self.exports = {} # print name -> export statistics
+        self.profile_path = None
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Context manager that times the phase run inside it."""
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append({"name": name, "seconds": round(time.perf_counter() - phase_start, 6)})
+
+    def add_export(self, name: str, stats: dict):
+        self.exports[name] = stats
+
+    def to_dict(self, config=None) -> dict:
+        import platform
+        report = {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "total_seconds": round(time.perf_counter() - self.start_time, 6),
+            "host": platform.node(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "phases": self.phases,
+            "exports": self.exports,
+            "profile": self.profile_path,
+        }
+        if config is not None:
+            report.update({"song_id": config.song_id, "version": config.version, "date_of_version": config.current_date})
+        return report
+
+    def write(self, path, config=None):
+        atomic_write_text(path, json.dumps(self.to_dict(config), indent=2))
+        print(f"Timing report saved to {os.path.basename(path)}")
+        return path
+
+# Helper function to build the statistics of one export for the BounceReport
+def export_stats(wav_path, output_paths: list, mode: str, total_seconds: float, decode_seconds: float = None) -> dict:
+    bytes_in = os.path.getsize(wav_path)
+    return {
+        "source": os.path.basename(wav_path),
+        "outputs": [os.path.basename(output_path) for output_path in output_paths],
+        "mode": mode,
+        "bytes_in": bytes_in,
+        "bytes_out": sum(os.path.getsize(output_path) for output_path in output_paths),
+        # When streaming the encoder decodes and encodes in one pass, so there is no separate decode time
+        "decode_seconds": None if decode_seconds is None else round(decode_seconds, 6),
+        "encode_seconds": round(total_seconds - (decode_seconds or 0.0), 6),
+        "total_seconds": round(total_seconds, 6),
+        "throughput_mb_per_s": round(bytes_in / total_seconds / 1e6, 3) if total_seconds > 0 else None,
+    }
+
+OUTPUT_FORMATS = {"mp3": "mp3", "ogg": "ogg", "flac": "flac", "wav": "wav"} # Profile format -> encoder container format
+LOSSLESS_FORMATS = {"flac", "wav"}
+COPY_FORMATS = {"wav"} # Delivered as exact copies of the print instead of being encoded
+
+# A deliverable format that every print is encoded to, written in the config.ini as format@bitrate, e.g. mp3@320k
+@dataclass(frozen=True, slots=True)
+class OutputProfile:
+    format: str = "mp3"
+    bitrate: str = "192k" # Always written as whole kbps, e.g. 320k, None for lossless formats
+
+    @property
+    def name(self) -> str:
+        return f"{self.format}@{self.bitrate}" if self.bitrate else self.format
+
+    @property
+    def container(self) -> str:
+        return OUTPUT_FORMATS[self.format]
+
+    @property
+    def kbps(self) -> int:
+        return int(self.bitrate[:-1]) if self.bitrate else None
+
+    @property
+    def codec(self) -> str:
+        """The encoder AudioSegment.export forces for this format, e.g. libvorbis for ogg, or None to let ffmpeg pick."""
+        from pydub import AudioSegment
+        return AudioSegment.DEFAULT_CODECS.get(self.container)
+
+    def encoder_args(self) -> list:
+        """The codec arguments for one output of this profile, the same ones AudioSegment.export passes."""
+        codec = self.codec
+        return (["-acodec", codec] if codec else []) + (["-b:a", self.bitrate] if self.bitrate else [])
+
+DEFAULT_OUTPUT_PROFILES = (OutputProfile(),)
+MP3_BITRATES = (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320) # kbps of MPEG-1 Layer III
+OGG_BITRATE_RANGE = (32, 500) # Nominal kbps libvorbis accepts for a stereo print
+ENCODER_BACKENDS = ("ffmpeg", "lameenc") # ffmpeg processes, or mp3s encoded in process by the LAME library
+LAME_SAMPLE_RATES = {8000, 11025, 12000, 16000, 22050, 24000, 32000, 44100, 48000}
+# Bitrate and sample rate tables of Layer III frame headers, by MPEG-1 or not and by MPEG version
+MP3_FRAME_BITRATES = {True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+                      False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)}
+MP3_FRAME_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+# Tags ffmpeg writes to a dedicated ID3 frame, every other tag becomes a TXXX frame
+ID3_TEXT_FRAMES = {"title": "TIT2", "artist": "TPE1", "album": "TALB", "album_artist": "TPE2", "composer": "TCOM",
+                   "genre": "TCON", "date": "TDRC", "track": "TRCK", "disc": "TPOS", "copyright": "TCOP",
+                   "publisher": "TPUB", "encoded_by": "TENC", "language": "TLAN"}
+
+# Helper function to read the bitrate of an output profile in kbps, e.g. 320 from '320k' or '320'
+def parse_bitrate(output_format: str, bitrate: str) -> int:
+    match = re.fullmatch(r"(\d+)\s*k?", bitrate.strip().lower())
+    kbps = int(match[1]) if match else None
+    if output_format == "mp3" and kbps not in MP3_BITRATES:
+        raise ValueError(f"'{bitrate}' is not an mp3 bitrate, use one of {', '.join(f'{rate}k' for rate in MP3_BITRATES)}")
+    if output_format != "mp3" and (kbps is None or not OGG_BITRATE_RANGE[0] <= kbps <= OGG_BITRATE_RANGE[1]):
+        raise ValueError(f"'{bitrate}' is not an {output_format} bitrate, "
+                         f"use {OGG_BITRATE_RANGE[0]}k to {OGG_BITRATE_RANGE[1]}k")
+    return kbps
+
+# Helper function to parse the comma separated outputProfiles option into OutputProfiles
+def parse_output_profiles(text: str) -> list:
+    """
+    Parses e.g. 'mp3@192k, mp3@320k, flac' into a list of OutputProfile, dropping duplicates.
+    Bitrates are in kbps with or without the k, so mp3@320 and mp3@320k are the same profile for every encoder backend.
+    Raises ValueError for an unknown format, a bitrate given to a lossless format or a bitrate the format can't be
+    encoded at.
+    """
+    profiles = []
+    for entry in text.split(","):
+        entry = entry.strip().lower()
+        if not entry:
+            continue
+        output_format, _, bitrate = entry.partition("@")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}' in outputProfiles, use one of {', '.join(OUTPUT_FORMATS)}")
+        if output_format in LOSSLESS_FORMATS:
+            if bitrate:
+                raise ValueError(f"The lossless output format '{output_format}' doesn't take a bitrate")
+            profile = OutputProfile(output_format, None)
+        else:
+            # The class attribute of a slots dataclass is a descriptor, so the default bitrate comes from an instance
+            profile = OutputProfile(output_format, f"{parse_bitrate(output_format, bitrate)}k") if bitrate else OutputProfile(output_format)
+        if profile not in profiles:
+            profiles.append(profile)
+    return profiles or list(DEFAULT_OUTPUT_PROFILES)
+
+# Helper function to name the file of every output profile of a print
+def get_output_paths(base_path, output_profiles: list = DEFAULT_OUTPUT_PROFILES) -> list:
+    """
+    Returns a list of (output path, OutputProfile) for base_path, a path without a file extension.
+    The first profile of each format keeps the plain name, later ones of the same format get their bitrate appended.
+    """
+    outputs = []
+    used_formats = set()
+    for profile in output_profiles:
+        suffix = f" {profile.bitrate}" if profile.format in used_formats else ""
+        used_formats.add(profile.format)
+        outputs.append((f"{base_path}{suffix}.{profile.format}", profile))
+    return outputs
+
+# Per project manifest of the prints that have already been encoded, so unchanged prints are never encoded twice
+class BounceCache:
+    """
+    Keeps track of the size, modification time and content hash of every print that has been encoded,
+    along with the files that were produced from each unique print and output profile.
+    The manifest is stored as json in the project's source directory.
+    """
+    def __init__(self, source_dir):
+        self.manifest_path = os.path.join(source_dir, BOUNCE_MANIFEST_NAME)
+        self.sources = {} # wav path -> {"size", "mtime", "sha256"}
+        self.outputs = {} # output key -> [output paths]
+        # The stems are looked up and recorded from a background thread while the master is encoded
+        self.lock = threading.RLock()
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path) as manifest_file:
+                    manifest = json.load(manifest_file)
+                self.sources = manifest.get("sources", {})
+                self.outputs = manifest.get("outputs", {})
+            except (OSError, ValueError):
+                print(f"Could not read {BOUNCE_MANIFEST_NAME}, every print will be encoded again")
+
+    def content_hash(self, wav_path) -> str:
+        """Returns the sha256 of wav_path, only reading the file if its size or modification time has changed."""
+        wav_path = os.path.abspath(wav_path)
+        stat = os.stat(wav_path)
+        entry = self.sources.get(wav_path)
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        digest = hash_file(wav_path)
+        with self.lock:
+            self.sources[wav_path] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha256": digest}
+        return digest
+
+    def mix_group_hash(self, stem_paths: list, ceiling_db: float = MIX_GROUP_CEILING_DB) -> str:
+        """
+        Returns a hash standing in for the content hash of a mix group rendered from stem_paths, so its encoded files
+        are found before it is rendered. It only changes when one of the prints or the ceiling does.
+        """
+        import hashlib
+        members = json.dumps([[self.content_hash(stem_path) for stem_path in stem_paths], ceiling_db])
+        return "mix:" + hashlib.sha256(members.encode()).hexdigest()
+
+    def output_key(self, wav_path, profile: OutputProfile = OutputProfile(), tags: dict = None,
+                   source_hash: str = None) -> str:
+        return json.dumps([source_hash or self.content_hash(wav_path), profile.format, profile.bitrate, tags or {}],
+                          sort_keys=True)
+
+    def lookup(self, wav_path, profile: OutputProfile = OutputProfile(), tags: dict = None, source_hash: str = None):
+        """
+        Returns the path of an existing file encoded from identical audio with the same profile and tags, or None.
+        source_hash is used instead of the content hash of wav_path when given, see mix_group_hash.
+        """
+        for output_path in self.outputs.get(self.output_key(wav_path, profile, tags, source_hash), []):
+            if os.path.isfile(output_path):
+                return output_path
+        return None
+
+    def record(self, wav_path, output_path, profile: OutputProfile = OutputProfile(), tags: dict = None,
+               source_hash: str = None):
+        """Adds output_path to the files known to be encoded from wav_path, dropping any that no longer exist."""
+        key = self.output_key(wav_path, profile, tags, source_hash)
+        output_path = os.path.abspath(output_path)
+        with self.lock:
+            known_paths = [path for path in self.outputs.get(key, []) if path != output_path and os.path.isfile(path)]
+            self.outputs[key] = [output_path] + known_paths
+
+    def forget(self, wav_path):
+        """Drops a print that is about to be removed, e.g. a mix group render, the files encoded from it are kept."""
+        with self.lock:
+            self.sources.pop(os.path.abspath(wav_path), None)
+
+    def save(self):
+        """Writes the manifest to a temporary file and renames it over the old one."""
+        # Saved from the stems thread after every export, the lock keeps an older manifest from replacing a newer one
+        with self.lock:
+            manifest = json.dumps({"sources": self.sources, "outputs": self.outputs}, indent=1)
+            atomic_write_text(self.manifest_path, manifest)
+
+# Helper function that makes a copy on write clone of a file, returns False where the filesystem can't clone
+def clone_file(source_path, destination_path) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False # Not available on Windows
+    try:
+        with open(source_path, "rb") as source_file, open(destination_path, "wb") as destination_file:
+            fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+    except OSError:
+        if os.path.exists(destination_path):
+            os.remove(destination_path)
+        return False
+    import shutil
+    shutil.copystat(source_path, destination_path)
+    return True
+
+# Helper function that gives a file a second name without a second copy of its data where the filesystem allows it
+def link_file(source_path, destination_path, allow_copy: bool = True) -> bool:
+    """
+    Tries a hardlink, then a copy on write clone, then a plain copy if allow_copy is set.
+    Returns True if the file was linked or cloned, False if it had to be (or would have to be) copied.
+    """
+    try:
+        os.link(source_path, destination_path)
+        return True
+    except OSError:
+        # Hardlinks are not supported across drives or on some filesystems
+        if clone_file(source_path, destination_path):
+            return True
+    if allow_copy:
+        import shutil
+        shutil.copy2(source_path, destination_path)
+    return False
+
+# Helper function that copies a file inside the kernel, so none of its data passes through Python
+def copy_file_kernel(source_path, destination_path) -> str:
+    """
+    Tries a copy on write clone first, then copy_file_range and then sendfile, which both copy in the kernel.
+    Falls back to copying through Python (shutil, itself a kernel copy on macOS) where none of them works,
+    or for the rest of the file when the kernel stops short of its size.
+    Returns the name of the method that was used.
+    """
+    if clone_file(source_path, destination_path):
+        return "reflink"
+    with open(source_path, "rb") as source_file, open(destination_path, "wb") as destination_file:
+        source_fd, destination_fd = source_file.fileno(), destination_file.fileno()
+        size, offset = os.fstat(source_fd).st_size, 0
+        for method in ("copy_file_range", "sendfile"):
+            try:
+                # Both calls are given the offset explicitly, sendfile writes at the position of the copy
+                os.lseek(destination_fd, offset, os.SEEK_SET)
+                while offset < size:
+                    if method == "copy_file_range":
+                        copied = os.copy_file_range(source_fd, destination_fd, size - offset, offset, offset)
+                    else:
+                        copied = os.sendfile(destination_fd, source_fd, offset, size - offset)
+                    if not copied:
+                        break # Some filesystems report 0 rather than an error when they can't copy any further
+                    offset += copied
+            except (AttributeError, OSError):
+                # Not available on this platform or between these filesystems, the next method carries on from offset
+                continue
+            if offset == size:
+                return method
+            break
+        import shutil
+        source_file.seek(offset)
+        destination_file.seek(offset)
+        shutil.copyfileobj(source_file, destination_file, STREAM_CHUNK_SIZE)
+    return "copy"
+
+# Helper function that delivers a print as an exact copy, checked against the print with a sha256 of both files
+def copy_print(wav_path, output_path, source_digest: str = None) -> str:
+    """
+    source_digest is the sha256 of the print when it is already known, e.g. from the BounceCache, so only the copy is read.
+    Returns the copy method, see copy_file_kernel. Raises RuntimeError if the copy doesn't match the print.
+    """
+    method = copy_file_kernel(wav_path, output_path)
+    if source_digest:
+        copy_digest = hash_file(output_path)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        # Both files are hashed side by side, hashlib lets go of the GIL while it hashes each block
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            source_digest, copy_digest = pool.map(hash_file, (wav_path, output_path))
+    if source_digest != copy_digest:
+        raise RuntimeError(f"The copy of {os.path.basename(wav_path)} doesn't match the print, "
+                           "it may have been changed while it was copied")
+    return method
+
+# Helper function to reuse an already encoded file, as a hardlink where possible so it takes up no extra space
+def reuse_output(cached_path, output_path):
+    if os.path.abspath(cached_path) == os.path.abspath(output_path):
+        return output_path
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    link_file(cached_path, output_path)
+    return output_path
+
+# Per project store of the files in the POST entries, addressed by the sha256 of their content
+class ObjectStore:
+    """
+    Every file added to a POST entry is linked into POST/.objects under its sha256, and a file whose content is already
+    in the store is replaced by a link to the stored copy. The POST entries of every version therefore share one copy of
+    each unique deliverable, and the store only grows with the files that actually changed.
+    """
+    def __init__(self, source_dir):
+        self.root = os.path.join(source_dir, "POST", OBJECT_STORE_DIR)
+
+    def object_path(self, digest: str, extension: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:] + extension)
+
+    def add(self, file_path, digest: str = None) -> str:
+        """
+        Deduplicates file_path against the store and returns the path of its stored object,
+        or None if the filesystem doesn't support hardlinks so storing it would only add another copy.
+        A duplicate is replaced by a hardlink to the stored object, or by a copy on write clone of it.
+        digest is the sha256 of file_path when it is already known, otherwise the file is read to work it out.
+        """
+        digest = digest or hash_file(file_path)
+        object_path = self.object_path(digest, os.path.splitext(file_path)[1])
+        if os.path.exists(object_path):
+            if not os.path.samefile(object_path, file_path):
+                # Swap the file for a link to the stored copy, through a temporary name so it is never missing
+                temp_path = f"{file_path}.{os.getpid()}.link"
+                if not link_file(object_path, temp_path, allow_copy=False):
+                    return None
+                os.replace(temp_path, file_path)
+            return object_path
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        # Objects are always hardlinks, so their link count tells prune whether any POST entry still uses them
+        try:
+            os.link(file_path, object_path)
+        except FileExistsError:
+            return self.add(file_path, digest) # Another bounce stored the same content first
+        except OSError:
+            return None
+        return object_path
+
+    def prune(self) -> int:
+        """Removes the hardlinked objects that are no longer part of any POST entry, returns how many were removed."""
+        removed = 0
+        if not os.path.isdir(self.root):
+            return removed
+        for dir_path, _, file_names in os.walk(self.root):
+            for file_name in file_names:
+                object_path = os.path.join(dir_path, file_name)
+                if os.stat(object_path).st_nlink == 1:
+                    os.remove(object_path)
+                    removed += 1
+        return removed
+
+# Helper function that reuses the cached file of every output that is unchanged and returns the ones left to encode
+def reuse_cached_outputs(wav_path, outputs: list, bounce_cache: BounceCache = None, tags: dict = None,
+                         movable_paths: set = frozenset(), source_hash: str = None) -> tuple:
+    """
+    outputs is a list of (output path, OutputProfile). Cached files in movable_paths are about to be removed,
+    so they are renamed to their new path instead of linked. source_hash is passed on to BounceCache.lookup.
+    Returns (reused output paths, list of (output path, OutputProfile) that still have to be encoded).
+    """
+    reused, pending = [], []
+    for output_path, profile in outputs:
+        cached_path = bounce_cache.lookup(wav_path, profile, tags, source_hash) if bounce_cache else None
+        if cached_path is None:
+            pending.append((output_path, profile))
+        elif cached_path in movable_paths:
+            os.replace(cached_path, output_path)
+            reused.append(output_path)
+        else:
+            reuse_output(cached_path, output_path)
+            reused.append(output_path)
+    return reused, pending
+
+# Journal of the phases and exports an unfinished bounce has completed, so a rerun resumes instead of starting over
+class BounceJournal:
+    """
+    Stored as json in the project's source directory for the version being bounced and saved after every step.
+    Each finished phase and exported file is recorded with the size and modification time of the print it came from,
+    so it is only skipped on a rerun if that print hasn't changed since. The journal is removed once the version is
+    incremented, and a journal left behind for any other version is ignored.
+    """
+    def __init__(self, source_dir, version: int):
+        self.journal_path = os.path.join(source_dir, BOUNCE_JOURNAL_NAME)
+        self.version = int(version)
+        self.phases = {} # phase name -> {"source": print stat or None, other phase data}
+        self.exports = {} # output path -> print stat
+        self.lock = threading.Lock()
+
+    @classmethod
+    def resume(cls, source_dir, version: int):
+        """Loads the journal of an interrupted bounce of version, or starts a new one."""
+        journal = cls(source_dir, version)
+        try:
+            with open(journal.journal_path) as journal_file:
+                data = json.load(journal_file)
+            if data.get("version") == journal.version:
+                journal.phases = data.get("phases", {})
+                journal.exports = data.get("exports", {})
+                print(f"Resuming the unfinished bounce of v{version}, finished phases: {', '.join(journal.phases) or 'none'}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            print(f"Could not read {BOUNCE_JOURNAL_NAME}, starting the bounce of v{version} from the beginning")
+        return journal
+
+    @staticmethod
+    def source_stat(wav_path):
+        if wav_path is None:
+            return None
+        stat = os.stat(wav_path)
+        return {"path": os.path.abspath(wav_path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    def save(self):
+        with self.lock:
+            text = json.dumps({"version": self.version, "phases": self.phases, "exports": self.exports}, indent=1)
+        atomic_write_text(self.journal_path, text)
+
+    def complete_phase(self, name: str, source_path=None, **data):
+        with self.lock:
+            self.phases[name] = dict(data, source=self.source_stat(source_path))
+        self.save()
+
+    def phase_done(self, name: str, source_path=None) -> dict:
+        """Returns the data recorded for phase name if it finished from the same print, otherwise None."""
+        phase = self.phases.get(name)
+        if phase is None or phase["source"] != self.source_stat(source_path):
+            return None
+        return phase
+
+    def record_exports(self, source_path, output_paths: list):
+        with self.lock:
+            for output_path in output_paths:
+                self.exports[os.path.abspath(output_path)] = self.source_stat(source_path)
+        self.save()
+
+    def is_exported(self, source_path, output_path) -> bool:
+        """True if output_path was completely written from the current version of source_path."""
+        recorded = self.exports.get(os.path.abspath(output_path))
+        return recorded is not None and os.path.isfile(output_path) and recorded == self.source_stat(source_path)
+
+    def clear(self):
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+# Manifest of the files published to the shared showcase folder, so previous versions are found without scanning it
+class ShowcaseManifest:
+    """
+    Maps each song ID to the version and file names of its masters in the showcase folder.
+    The first time a showcase folder is used the manifest is built from the existing file names, after that it is
+    only ever updated inside transaction(), which holds a lock file so bounces running side by side don't clash.
+    """
+    def __init__(self, showcase_dir):
+        self.showcase_dir = showcase_dir
+        self.manifest_path = os.path.join(showcase_dir, SHOWCASE_MANIFEST_NAME)
+        self.songs = {} # song ID -> {"version", "files"}
+
+    def load(self):
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path) as manifest_file:
+                    self.songs = json.load(manifest_file)["songs"]
+                return self
+            except (OSError, ValueError, KeyError):
+                print(f"Could not read {SHOWCASE_MANIFEST_NAME}, indexing the showcase directory again")
+        # Build the manifest from the file names, matching the song ID exactly instead of as a substring
+        self.songs = {}
+        with os.scandir(self.showcase_dir) as entries:
+            for entry in entries:
+                match = SHOWCASE_FILENAME_PATTERN.match(entry.name)
+                if match and entry.is_file():
+                    song = self.songs.setdefault(match["song_id"], {"version": 0, "files": []})
+                    song["version"] = max(song["version"], int(match["version"]))
+                    song["files"].append(entry.name)
+        return self
+
+    def save(self):
+        atomic_write_text(self.manifest_path, json.dumps({"songs": self.songs}, indent=1, sort_keys=True))
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Loads the manifest under the lock file and saves it again at the end of the with block."""
+        with file_lock(self.manifest_path):
+            self.load()
+            yield self
+            self.save()
+
+    def files(self, song_id) -> list:
+        """Returns the full paths of the files published for song_id."""
+        return [os.path.join(self.showcase_dir, file_name) for file_name in self.songs.get(song_id, {}).get("files", [])]
+
+    def publish(self, song_id, version, file_names: list, keep_previous: bool = False):
+        """Records file_names as the files of song_id, on top of the previous ones if keep_previous is set."""
+        song = self.songs.setdefault(song_id, {"version": 0, "files": []})
+        previous_files = [file_name for file_name in song["files"]
+                          if keep_previous and file_name not in file_names
+                          and os.path.exists(os.path.join(self.showcase_dir, file_name))]
+        self.songs[song_id] = {"version": int(version), "files": previous_files + list(file_names)}
+
+# Copy the Master Track into a new Song Showcase Directories Folder in every output profile
 # Check the version number of the project and append that to the name of the copied master
 # If a previous version of the master is found in the Bounced Directories, replace it with this version
 def copy_Master_to_ShowcaseDir(master_file, showcase_dir, source_dir,
                                song_id, version, artist, song_name, bpm, key, time_signature,
                                non_standard_time_signature_flag: bool,
-                               save_master_editions_flag: bool):
+                               save_master_editions_flag: bool,
+                               streaming_export_flag: bool = True,
+                               bounce_cache: BounceCache = None,
+                               interactive: bool = True,
+                               report: BounceReport = None,
+                               output_profiles: list = DEFAULT_OUTPUT_PROFILES,
+                               waveform_peaks_flag: bool = True,
+                               encoder_backend: str = "ffmpeg"):
+    if master_file is None:
+        print("\nCould not copy Master Track to Showcase Directory. Stopping Bouncer process \n")
+        stop_bouncer(interactive)
+
+    tags = {"artist": artist, "title": song_name}
+
     # Ensure the destination directory exists
     if not os.path.exists(showcase_dir):
         os.makedirs(showcase_dir)
     # Remove any previous version of the audio file in the destination directory if found depending on whether the saveMasterEditions flag is selected.
-    if not save_master_editions_flag:
-        for file_name in os.listdir(showcase_dir):
-            if song_id in file_name or ( artist in file_name and song_name in file_name):
-                prev_version_path = os.path.join(showcase_dir, file_name)
-                os.remove(prev_version_path)
-                print(f"Removed previous version: {os.path.basename(prev_version_path)}")
+    # The previous versions are looked up in the showcase manifest rather than by scanning the folder
+    showcase_manifest = ShowcaseManifest(showcase_dir)
+    with showcase_manifest.transaction():
+        previous_versions = [] if save_master_editions_flag else list(map(os.path.abspath, showcase_manifest.files(song_id)))
 
-    if master_file is None:
-        print("\nCould not copy Master Track to Showcase Directory. Stopping Bouncer process \n")
-        EXIT = input("Press Enter to exit script")
-        raise(SystemExit(1))
+    # Lossless copies of the print are only delivered into the POST entry, the showcase keeps to the encoded formats
+    output_profiles = [profile for profile in output_profiles if profile.format not in COPY_FORMATS] or DEFAULT_OUTPUT_PROFILES
 
-    # Construct the new filename
+    # Construct the new filename of every output profile
     time_signature = (f" {format_for_filename(time_signature)} "
            if non_standard_time_signature_flag else " ")
-    new_filename = f'{song_id} v{version} [[{format_for_filename(artist, artistsFlag=True)}] - [{format_for_filename(song_name)}]] {bpm}{time_signature}{key}.mp3'
-    print(f"Adding latest master to showcase directory: {new_filename}")
-
-    master_track = AudioSegment.from_file(master_file, format="wav")
+    new_basename = f'{song_id} v{version} [[{format_for_filename(artist, artistsFlag=True)}] - [{format_for_filename(song_name)}]] {bpm}{time_signature}{key}'
+    outputs = get_output_paths(os.path.join(showcase_dir, new_basename), output_profiles)
+
+    # A previous version encoded from the same master is renamed rather than removed and encoded again
+    export_start = time.perf_counter()
+    reused, pending = reuse_cached_outputs(master_file, outputs, bounce_cache, tags, movable_paths=set(previous_versions))
+    for prev_version_path in previous_versions:
+        if os.path.exists(prev_version_path) and prev_version_path not in map(os.path.abspath, reused):
+            os.remove(prev_version_path)
+            print(f"Removed previous version: {os.path.basename(prev_version_path)}")
+    for output_path in reused:
+        print(f"Master is unchanged, reusing the previous encode as: {os.path.basename(output_path)}")
+
+    # The waveform peaks are collected from the same chunks of the master that are piped to the encoder
+    peaks = None
+    if waveform_peaks_flag:
+        try:
+            peaks = WaveformPeaks(probe_wav(master_file))
+        except ImportError:
+            print("numpy is not installed, skipping the waveform peaks. Install it with 'pip install numpy'")
+        except ValueError as error:
+            print(f"Could not read {os.path.basename(master_file)} for its waveform peaks: {error}")
+
+    if pending:
+        print(f"Adding latest master to showcase directory: {', '.join(os.path.basename(path) for path, _ in pending)}")
+        stats = export_wav(master_file, pending, tags=tags, streaming=streaming_export_flag,
+                           on_chunk=peaks.add_bytes if peaks else None, encoder_backend=encoder_backend)
+    else:
+        stats = export_stats(master_file, reused, "reused", time.perf_counter() - export_start)
+    if report:
+        report.add_export("SHOWCASE MASTER", stats)
+
+    published_files = [os.path.basename(output_path) for output_path, _ in outputs]
+    if peaks:
+        # Reused and pydub exports never stream the master, so its peaks are read from it directly.
+        # The peaks are optional, so failing to write them never stops the master from being published
+        try:
+            if not peaks.complete:
+                for block in iter_wav_blocks(master_file, info=peaks.info):
+                    peaks.add_samples(block)
+            peaks_path = peaks.write(os.path.join(showcase_dir, f"{new_basename}.peaks.json"))
+            published_files.append(os.path.basename(peaks_path))
+            print(f"Saved waveform peaks: {os.path.basename(peaks_path)}")
+        except (OSError, ValueError) as error:
+            print(f"Could not write the waveform peaks of {os.path.basename(master_file)}: {error}")
+
+    if bounce_cache:
+        for output_path, profile in outputs:
+            bounce_cache.record(master_file, output_path, profile, tags)
+    with showcase_manifest.transaction():
+        showcase_manifest.publish(song_id, version, published_files, keep_previous=save_master_editions_flag)
+    print(f"Added latest version: {new_basename}")
+
+# Helper function that pipes a .wav file to the encoder in fixed size chunks instead of decoding it into memory first
+def stream_wav_to_outputs(wav_path, outputs: list, tags: dict = None, chunk_size: int = STREAM_CHUNK_SIZE,
+                          on_chunk=None):
+    """
+    Encodes wav_path to every (output path, OutputProfile) in outputs while only ever holding chunk_size bytes of audio in memory.
+    A single encoder process decodes the print once and feeds the samples to one encoder per output.
+    on_chunk is called with every chunk of the file as it is piped, so other work can share the same read.
+    The encoder is called with the same arguments that AudioSegment.export uses so the output and tags match.
+    """
+    import subprocess
+    import tempfile
+    from pydub.utils import get_encoder_name
+    command = [get_encoder_name(), "-y", "-f", "wav", "-i", "pipe:0"]
+    for output_path, profile in outputs:
+        command.extend(profile.encoder_args())
+        if tags:
+            for tag, value in tags.items():
+                command.extend(["-metadata", f"{tag}={value}"])
+            if profile.format == "mp3":
+                command.extend(["-id3v2_version", "4"])
+        command.extend(["-f", profile.container, output_path])
+
+    # The encoder log goes to a temporary file so a full stderr pipe can never stall the stream
+    with open(wav_path, "rb") as wav_file, tempfile.TemporaryFile() as encoder_log:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE,
+                                   stdout=subprocess.DEVNULL, stderr=encoder_log)
+        try:
+            for chunk in iter(lambda: wav_file.read(chunk_size), b""):
+                if on_chunk is not None:
+                    on_chunk(chunk)
+                process.stdin.write(chunk)
+        except BrokenPipeError:
+            pass # The encoder exited early, its return code and log explain why
+        finally:
+            process.stdin.close()
+        return_code = process.wait()
+        if return_code != 0:
+            encoder_log.seek(0)
+            raise RuntimeError(f"Encoding {os.path.basename(wav_path)} failed with code {return_code}:\n"
+                               f"{encoder_log.read().decode(errors='replace')}")
+    return [output_path for output_path, _ in outputs]
+
+# Helper function to build an ID3v2.4 tag for the mp3s encoded in process, which LAME itself leaves untagged
+def build_id3_tag(tags: dict) -> bytes:
+    """
+    Writes the tags ffmpeg knows by name (title, artist, album, ...) to the same ID3 frames ffmpeg uses and any other
+    tag to a TXXX user text frame, as ffmpeg does. Every frame is UTF-8 encoded. Returns b"" when there are no tags.
+    """
+    def syncsafe(size: int) -> bytes:
+        return bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+
+    frames = b""
+    for tag, value in (tags or {}).items():
+        frame_id = ID3_TEXT_FRAMES.get(tag.lower())
+        body = b"\x03" + (str(value) if frame_id else f"{tag}\x00{value}").encode("utf-8")
+        frames += (frame_id or "TXXX").encode("ascii") + syncsafe(len(body)) + b"\x00\x00" + body
+    return b"ID3\x04\x00\x00" + syncsafe(len(frames)) + frames if frames else b""
+
+# Helper function to check whether an output of a print can be encoded in process by the lameenc backend
+def can_encode_in_process(info: WavInfo, profile: OutputProfile) -> bool:
+    return profile.format == "mp3" and info.channels <= 2 and info.sample_rate in LAME_SAMPLE_RATES
+
+# Helper function to read the length of a Layer III frame from its 4 byte header, None if the bytes aren't one
+def mp3_frame_length(header: bytes):
+    value = int.from_bytes(header[:4], "big")
+    version, layer = (value >> 19) & 3, (value >> 17) & 3 # Version 3 is MPEG-1, 2 and 0 are MPEG-2 and 2.5
+    bitrate_index, rate_index, padding = (value >> 12) & 15, (value >> 10) & 3, (value >> 9) & 1
+    if len(header) < 4 or value >> 21 != 0x7FF or version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    kbps = MP3_FRAME_BITRATES[version == 3][bitrate_index]
+    sample_rate = MP3_FRAME_SAMPLE_RATES[version][rate_index]
+    return (144000 if version == 3 else 72000) * kbps // sample_rate + padding
 
-    file_handle = master_track.export(os.path.join(showcase_dir, new_filename),
-                               format="mp3",
-                               bitrate="192k",
-                               tags={"artist": artist,
-                                     "title":song_name})
-    print(f"Added latest version: {os.path.basename(os.path.join(showcase_dir, new_filename))}")
+# Helper function to build the Info frame that tells players how many frames and bytes a constant bitrate mp3 has
+def build_info_frame(first_header: bytes, frame_count: int, byte_count: int) -> bytes:
+    """
+    first_header is the header of the first audio frame, the Info frame is an empty frame with the same format.
+    byte_count includes the Info frame itself, frame_count doesn't. Without it players guess the length of the mp3
+    from its size and bitrate and seek inaccurately.
+    """
+    value = int.from_bytes(first_header[:4], "big")
+    value = (value | 0x10000) & ~0x200 # No CRC and no padding
+    header = value.to_bytes(4, "big")
+    mpeg1, mono = (value >> 19) & 3 == 3, (value >> 6) & 3 == 3
+    side_info_length = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    info = header + bytes(side_info_length) + b"Info" + struct.pack(">III", 0x3, frame_count, byte_count) # Frames and bytes fields
+    return info + bytes(mp3_frame_length(header) - len(info))
+
+# Encode a .wav print to mp3 inside this process with the LAME library, so no encoder process is started at all
+def encode_wav_lameenc(wav_path, outputs: list, tags: dict = None, chunk_size: int = STREAM_CHUNK_SIZE,
+                       on_chunk=None, info: WavInfo = None):
+    """
+    outputs is a list of (output path, OutputProfile) of mp3 profiles, see can_encode_in_process.
+    The print is read chunk_size bytes at a time and every chunk goes to one LAME encoder per output,
+    on_chunk is handed each chunk of the file just like stream_wav_to_outputs does.
+    LAME runs with the same settings as ffmpeg's libmp3lame defaults (constant bitrate, quality 3), and each mp3 starts
+    with an Info frame holding its frame and byte counts like ffmpeg writes, but the files aren't byte for byte the same.
+    LAME only takes 16 bit samples, so 24 bit and float prints are reduced to 16 bit with TPDF dither first, which needs
+    numpy. The dither is seeded, so the same print always encodes to the same mp3.
+    """
+    import lameenc
+    info = info or probe_wav(wav_path)
+    native_pcm = info.format_tag != WAVE_FORMAT_IEEE_FLOAT and info.bit_depth == 16
+    encoders = []
+    for _, profile in outputs:
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(profile.kbps)
+        encoder.set_in_sample_rate(info.sample_rate)
+        encoder.set_channels(info.channels)
+        encoder.set_quality(3)
+        encoders.append(encoder)
+
+    if not native_pcm:
+        import numpy as np
+        dither = np.random.default_rng(0)
+
+    # Room is left for the Info frame once the first audio frame shows its format, it is filled in at the end
+    id3_tag = build_id3_tag(tags)
+    first_frames = [bytearray() for _ in outputs] # Audio held back until it holds the header of the first frame
+    info_frame_lengths = [None] * len(outputs)
+    def write_audio(index: int, mp3_file, audio: bytes):
+        if info_frame_lengths[index] is None:
+            first_frames[index] += audio
+            if len(first_frames[index]) < 4:
+                return
+            info_frame_lengths[index] = mp3_frame_length(first_frames[index]) or 0
+            mp3_file.write(bytes(info_frame_lengths[index]))
+            audio, first_frames[index] = bytes(first_frames[index]), None
+        mp3_file.write(audio)
+
+    data_start, data_end = info.data_offset, info.data_offset + info.data_size
+    position, partial_frame = 0, b""
+    with open(wav_path, "rb") as wav_file, contextlib.ExitStack() as stack:
+        mp3_files = [stack.enter_context(open(output_path, "wb")) for output_path, _ in outputs]
+        for mp3_file in mp3_files:
+            mp3_file.write(id3_tag)
+        for chunk in iter(lambda: wav_file.read(chunk_size), b""):
+            if on_chunk is not None:
+                on_chunk(chunk)
+            # Only whole frames of the data chunk are encoded, the header and any trailing chunks are skipped
+            start, end = max(position, data_start) - position, min(position + len(chunk), data_end) - position
+            position += len(chunk)
+            if start >= end:
+                continue
+            audio = partial_frame + chunk[start:end]
+            whole_bytes = len(audio) - len(audio) % info.block_align
+            partial_frame = audio[whole_bytes:]
+            if not whole_bytes:
+                continue
+            if native_pcm:
+                pcm = audio[:whole_bytes]
+            else:
+                samples = decode_wav_samples(audio[:whole_bytes], info) * 32768.0
+                # Triangular dither of +-1 LSB decorrelates the rounding error from the signal
+                samples += dither.random(samples.shape, dtype=np.float32) - dither.random(samples.shape, dtype=np.float32)
+                pcm = np.clip(np.round(samples), -32768, 32767).astype("<i2").tobytes()
+            for index, (encoder, mp3_file) in enumerate(zip(encoders, mp3_files)):
+                write_audio(index, mp3_file, encoder.encode(pcm))
+        for index, (encoder, mp3_file) in enumerate(zip(encoders, mp3_files)):
+            write_audio(index, mp3_file, encoder.flush())
+
+    for (output_path, _), info_frame_length in zip(outputs, info_frame_lengths):
+        if info_frame_length:
+            write_info_frame(output_path, len(id3_tag), info_frame_length)
+    return [output_path for output_path, _ in outputs]
+
+# Helper function that counts the audio frames of an mp3 written by encode_wav_lameenc and fills in its Info frame
+def write_info_frame(mp3_path, audio_start: int, info_frame_length: int):
+    with open(mp3_path, "r+b") as mp3_file, mmap.mmap(mp3_file.fileno(), 0) as data:
+        first_frame = audio_start + info_frame_length
+        offset, frame_count = first_frame, 0
+        # Only the 4 byte header of each frame is read, the walk jumps from one frame to the next
+        while offset + 4 <= len(data):
+            frame_length = mp3_frame_length(data[offset:offset + 4])
+            if not frame_length:
+                break
+            offset += frame_length
+            frame_count += 1
+        data[audio_start:first_frame] = build_info_frame(data[first_frame:first_frame + 4], frame_count,
+                                                         len(data) - audio_start)
+
+# Helper function to check the encoderBackend option, falling back to ffmpeg when the in process encoder isn't installed
+def get_encoder_backend(name: str) -> str:
+    """Raises ValueError for an unknown backend."""
+    name = name.strip().lower()
+    if name not in ENCODER_BACKENDS:
+        raise ValueError(f"Unknown encoderBackend '{name}', use one of {', '.join(ENCODER_BACKENDS)}")
+    if name == "lameenc":
+        try:
+            import lameenc
+        except ImportError:
+            print("lameenc is not installed, encoding with ffmpeg instead. Install it with 'pip install lameenc'")
+            return "ffmpeg"
+    return name
+
+# Helper function to get the hidden temporary name a file is written under until it is complete
+def get_part_path(path) -> str:
+    directory, file_name = os.path.split(path)
+    return os.path.join(directory, f".{file_name}.part")
+
+# Helper function that exports a .wav file to every output profile, either streamed or decoded in memory with pydub
+def export_wav(wav_path, outputs: list, tags: dict = None, streaming: bool = True, on_chunk=None,
+               encoder_backend: str = "ffmpeg", source_digest: str = None) -> dict:
+    """
+    outputs is a list of (output path, OutputProfile), the print is decoded only once however many there are.
+    When streaming, on_chunk is handed every chunk of the print as it is read, see stream_wav_to_outputs.
+    With the lameenc encoder backend the mp3 outputs are encoded in process and only the rest go to ffmpeg.
+    wav outputs are not encoded at all, the print itself is copied in the kernel and checked against source_digest
+    (the sha256 of the print) if it is known, see copy_print.
+    Returns the export statistics of the print, see export_stats.
+    """
+    start_time = time.perf_counter()
+    output_paths = [output_path for output_path, _ in outputs]
+    # Every output is written under a hidden .part name and only renamed once it is complete,
+    # so nobody picking up the deliverables ever sees a half written file
+    part_outputs = [(get_part_path(output_path), profile) for output_path, profile in outputs]
+    copy_outputs = [output for output in part_outputs if output[1].format in COPY_FORMATS]
+    in_process_outputs = []
+    if encoder_backend == "lameenc":
+        try:
+            info = probe_wav(wav_path)
+            in_process_outputs = [output for output in part_outputs if can_encode_in_process(info, output[1])]
+        except ValueError:
+            pass # ffmpeg reads more kinds of .wav file than probe_wav, so it encodes this print
+    encoder_outputs = [output for output in part_outputs if output not in in_process_outputs + copy_outputs]
+    modes = (["lameenc"] if in_process_outputs else []) + (["streaming" if streaming else "pydub"] if encoder_outputs else [])
+    decode_seconds = None
+    try:
+        if in_process_outputs:
+            encode_wav_lameenc(wav_path, in_process_outputs, tags=tags, on_chunk=on_chunk, info=info)
+            on_chunk = None # The print has already been read once
+        if encoder_outputs and streaming:
+            stream_wav_to_outputs(wav_path, encoder_outputs, tags=tags, on_chunk=on_chunk)
+        elif encoder_outputs:
+            from pydub import AudioSegment
+            from concurrent.futures import ThreadPoolExecutor
+            decode_start = time.perf_counter()
+            track = AudioSegment.from_file(wav_path, format="wav")
+            decode_seconds = time.perf_counter() - decode_start
+            # The decoded samples are shared by every encoder, which run side by side as separate processes
+            with ThreadPoolExecutor(max_workers=len(encoder_outputs)) as pool:
+                exports = [pool.submit(track.export, part_path, format=profile.container, codec=profile.codec,
+                                       bitrate=profile.bitrate, tags=tags)
+                           for part_path, profile in encoder_outputs]
+                for export in exports:
+                    export.result().close()
+        for part_path, _ in copy_outputs:
+            modes.append(copy_print(wav_path, part_path, source_digest))
+        for (part_path, _), output_path in zip(part_outputs, output_paths):
+            os.replace(part_path, output_path)
+    finally:
+        for part_path, _ in part_outputs:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+    return export_stats(wav_path, output_paths, "+".join(modes), time.perf_counter() - start_time, decode_seconds)
+
+# Worker function run inside the export process pool, so it has to live at module level to be picklable
+def export_stem(stem_path, outputs: list, streaming: bool = True, encoder_backend: str = "ffmpeg",
+                source_digest: str = None):
+    """Export a single .wav stem print to every (output path, OutputProfile) in outputs."""
+    return export_wav(stem_path, outputs, streaming=streaming, encoder_backend=encoder_backend, source_digest=source_digest)
+
+# The export worker processes, kept alive between exports so batch runs and repeated bounces start them only once
+class ExportPool:
+    executor = None
+    workers = 0
+    owner_pid = None
+
+    @classmethod
+    def get(cls, workers: int):
+        """Returns the shared process pool, starting it on first use and restarting it only to grow it to workers processes."""
+        if cls.owner_pid != os.getpid():
+            # A forked batch worker inherits the pool of its parent, which it can't use
+            cls.executor, cls.workers = None, 0
+        if cls.executor is None or workers > cls.workers:
+            cls.shutdown()
+            import multiprocessing.util
+            from concurrent.futures import ProcessPoolExecutor
+            # The workers are spawned rather than forked, as the pool is started while other threads are encoding
+            # and a forked worker could inherit a lock one of them holds
+            cls.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            cls.workers, cls.owner_pid = workers, os.getpid()
+            # A batch worker process waits for its own child processes before it exits, so the pool is stopped first,
+            # ahead of the finalizers that close the queues the pool needs to shut down
+            multiprocessing.util.Finalize(None, cls.shutdown, exitpriority=100)
+        return cls.executor
+
+    @classmethod
+    def shutdown(cls):
+        """Stops the worker processes, the next export starts a new pool. Also used to replace a pool a worker crashed in."""
+        if cls.executor is not None:
+            cls.executor.shutdown(wait=True)
+            cls.executor, cls.workers = None, 0
+
+# Helper function that fans the per stem decode + encode work out over a pool of processes
+def export_stems_parallel(jobs: dict, workers: int = 0, streaming: bool = True,
+                          report: BounceReport = None, encoder_backend: str = "ffmpeg", on_export=None,
+                          source_digests: dict = None):
+    """
+    Exports every stem in jobs ({stem name: (stem_path, [(output path, OutputProfile)])}) using the shared ExportPool.
+    A worker count of 0 uses one worker per CPU core. The statistics of each export are added to report if given.
+    on_export is called with the name of each stem as soon as it has been exported, while the rest carry on.
+    source_digests maps stem names to the sha256 of their print where it is already known, see copy_print.
+    Returns a dictionary mapping each stem name to None on success or the raised exception on failure.
+    """
+    results = {}
+    if not jobs:
+        return results
+    source_digests = source_digests or {}
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    workers = min(workers, len(jobs))
+
+    if workers == 1:
+        # No need to pay the process start up cost for a single worker
+        for stem_name, (stem_path, outputs) in jobs.items():
+            try:
+                stats = export_stem(stem_path, outputs, streaming=streaming, encoder_backend=encoder_backend,
+                                    source_digest=source_digests.get(stem_name))
+                results[stem_name] = None
+                if report:
+                    report.add_export(stem_name, stats)
+                print(f"Exported {', '.join(stats['outputs'])} into STEMS folder")
+                if on_export:
+                    on_export(stem_name)
+            except Exception as error:
+                results[stem_name] = error
+                print(f"Failed to export {stem_name}: {error}")
+    else:
+        from concurrent.futures import as_completed
+        from concurrent.futures.process import BrokenProcessPool
+        print(f"Exporting {len(jobs)} stems using {workers} worker processes")
+        pool = ExportPool.get(workers)
+        futures = {pool.submit(export_stem, stem_path, outputs, streaming=streaming, encoder_backend=encoder_backend,
+                               source_digest=source_digests.get(stem_name)): stem_name
+                   for stem_name, (stem_path, outputs) in jobs.items()}
+        for future in as_completed(futures):
+            stem_name = futures[future]
+            try:
+                stats = future.result()
+                results[stem_name] = None
+                if report:
+                    report.add_export(stem_name, stats)
+                print(f"Exported {', '.join(stats['outputs'])} into STEMS folder")
+                if on_export:
+                    on_export(stem_name)
+            except Exception as error:
+                results[stem_name] = error
+                print(f"Failed to export {stem_name}: {error}")
+                if isinstance(error, BrokenProcessPool):
+                    ExportPool.shutdown() # A worker died, the next export starts a fresh pool
+
+    # Report the per stem outcome once every export has finished, in the same order as the stems were queued
+    results = {stem_name: results[stem_name] for stem_name in jobs}
+    print("\nStem export summary:")
+    for stem_name, error in results.items():
+        print(f"  {'OK' if error is None else 'FAILED':<7}{stem_name}" + (f" ({error})" if error is not None else ""))
+    failed_count = sum(error is not None for error in results.values())
+    print(f"{len(results) - failed_count} of {len(results)} stems exported successfully\n")
+    return results
+
+# Helper function for the impulse response of the ITU-R BS.1770 K-weighting filter
+def k_weighting_impulse_response(sample_rate: int, length: int):
+    """
+    Runs an impulse through the K-weighting pre-filter (high shelf) and RLB filter (high pass) biquads designed for
+    sample_rate, returning the first length samples of their response as a float64 numpy array.
+    The response has decayed below -200 dB within 100 ms, so that length is enough to filter by convolution.
+    """
+    import numpy as np
+    # High shelf pre-filter
+    gain_db, shelf_frequency, shelf_q = 3.999843853973347, 1681.974450955533, 0.7071752369554196
+    k = np.tan(np.pi * shelf_frequency / sample_rate)
+    vh, vb = 10 ** (gain_db / 20), 10 ** (gain_db / 20 * 0.4996667741545416)
+    a0 = 1 + k / shelf_q + k * k
+    shelf_b = [(vh + vb * k / shelf_q + k * k) / a0, 2 * (k * k - vh) / a0, (vh - vb * k / shelf_q + k * k) / a0]
+    shelf_a = [1.0, 2 * (k * k - 1) / a0, (1 - k / shelf_q + k * k) / a0]
+    # Revised low frequency B-curve high pass
+    pass_frequency, pass_q = 38.13547087602444, 0.5003270373238773
+    k = np.tan(np.pi * pass_frequency / sample_rate)
+    a0 = 1 + k / pass_q + k * k
+    pass_b = [1.0, -2.0, 1.0]
+    pass_a = [1.0, 2 * (k * k - 1) / a0, (1 - k / pass_q + k * k) / a0]
+
+    response = np.zeros(length)
+    response[0] = 1.0
+    for b, a in ((shelf_b, shelf_a), (pass_b, pass_a)):
+        # Direct form I, run once per print over a short impulse so a plain loop is fast enough
+        x1 = x2 = y1 = y2 = 0.0
+        for index, x in enumerate(response.tolist()):
+            y = b[0] * x + b[1] * x1 + b[2] * x2 - a[1] * y1 - a[2] * y2
+            response[index] = y
+            x1, x2, y1, y2 = x, x1, y, y1
+    return response
+
+# Helper function to convert a linear level into decibels, None for digital silence so the json stays valid
+def to_decibels(value: float, power: bool = False):
+    import math
+    if value <= 0:
+        return None
+    return round((10 if power else 20) * math.log10(value), 2)
 
-# Helper function to create a new entry in the release notes directory
-def create_release_note(source_dir, config_filename=CONFIGFILE_NAME,
-                        non_standard_time_signature: bool = False,
-                        custom_comments_flag: bool = True):
-    # Initialising configParser file and creating release notes directory if not already created
+# Measure the loudness, peaks and clipping of a .wav print in fixed size blocks
+def analyse_wav(wav_path) -> dict:
+    """
+    Returns the integrated loudness (LUFS), true peak (dBTP), sample peak and RMS (dBFS) and the number of clipped samples.
+    The loudness follows ITU-R BS.1770 gating over 400 ms blocks with a 100 ms hop. The K-weighting is applied by
+    overlap-add convolution with the impulse response of the filter, carrying its tail from block to block. Against
+    the time domain biquads it measured within 0.005 LU (under the 0.01 the result is rounded to) on 25 Hz to 10 kHz
+    sines, kicks and noise at 44.1, 48 and 96 kHz.
+    The true peak is the sample peak of the print oversampled 4 times. Requires numpy.
+    """
+    import numpy as np
+    info = probe_wav(wav_path)
+    hop = max(1, round(info.sample_rate * 0.1))
+    impulse_response = k_weighting_impulse_response(info.sample_rate, hop)
+    filter_spectra = {} # FFT length -> spectrum of the impulse response, every block but the last has the same length
+    # Surround channels are weighted up by 1.5 dB and the LFE channel of a 5.1 print is left out
+    channel_weights = {5: [1.0, 1.0, 1.0, 1.41, 1.41], 6: [1.0, 1.0, 1.0, 0.0, 1.41, 1.41]}.get(info.channels,
+                                                                                        [1.0] * info.channels)
+    channel_weights = np.asarray(channel_weights, dtype=np.float64)
+    # Integer prints clip at their largest sample value, float prints once they go over full scale
+    clip_level = 1.0 if info.format_tag == WAVE_FORMAT_IEEE_FLOAT else 1.0 - 2.0 ** (1 - info.bit_depth)
+
+    oversampling, overlap = 4, 64
+    hop_energies = []
+    sample_peak = true_peak = sum_of_squares = 0.0
+    clipped_samples = 0
+    pending = np.zeros((0, info.channels)) # Squared K-weighted samples short of a whole 100 ms hop
+    filter_tail = np.zeros((hop - 1, info.channels)) # Filter output of the previous blocks that rings into the next one
+    history = np.zeros((2 * overlap, info.channels), dtype=np.float32) # Edge of the previous block for oversampling
+
+    def oversampled_peak(samples):
+        # Zero padding the spectrum resamples the block, its first and last overlap frames ring so they are dropped.
+        # The block is padded to a power of two length as the FFT is many times slower for lengths with large prime factors
+        fft_length = 1 << (len(samples) - 1).bit_length()
+        spectrum = np.fft.rfft(samples, n=fft_length, axis=0)
+        upsampled = np.fft.irfft(spectrum, n=fft_length * oversampling, axis=0) * oversampling
+        kept = upsampled[overlap * oversampling:(len(samples) - overlap) * oversampling]
+        return float(np.abs(kept).max(initial=0.0))
+
+    for block in iter_wav_blocks(wav_path, block_frames=hop * 30, info=info):
+        magnitudes = np.abs(block)
+        sample_peak = max(sample_peak, float(magnitudes.max(initial=0.0)))
+        clipped_samples += int(np.count_nonzero(magnitudes >= clip_level))
+        sum_of_squares += float(np.square(block, dtype=np.float64).sum())
+
+        segment = np.concatenate((history, block))
+        if len(segment) > 2 * overlap:
+            true_peak = max(true_peak, oversampled_peak(segment))
+        history = segment[-2 * overlap:]
+
+        # Overlap-add: the block is convolved on its own and the ringing it leaves past its end is added to the next one
+        fft_length = 1 << (len(block) + hop - 2).bit_length()
+        if fft_length not in filter_spectra:
+            filter_spectra[fft_length] = np.fft.rfft(impulse_response, n=fft_length)[:, None]
+        weighted = np.fft.irfft(np.fft.rfft(block, n=fft_length, axis=0) * filter_spectra[fft_length], n=fft_length, axis=0)
+        weighted[:hop - 1] += filter_tail
+        filter_tail = weighted[len(block):len(block) + hop - 1]
+        pending = np.concatenate((pending, np.square(weighted[:len(block)])))
+        whole_hops = len(pending) // hop
+        if whole_hops:
+            mean_squares = pending[:whole_hops * hop].reshape(whole_hops, hop, info.channels).mean(axis=1)
+            hop_energies.append(mean_squares @ channel_weights)
+            pending = pending[whole_hops * hop:]
+    # The last overlap frames only get oversampled once the print is padded with silence
+    true_peak = max(true_peak, oversampled_peak(np.concatenate((history, np.zeros_like(history)))), sample_peak)
+
+    integrated_loudness = None
+    hop_energies = np.concatenate(hop_energies) if hop_energies else np.zeros(0)
+    if len(hop_energies) >= 4:
+        # Each 400 ms gating block is the mean of four consecutive 100 ms hops
+        cumulative = np.concatenate(([0.0], np.cumsum(hop_energies)))
+        block_energies = (cumulative[4:] - cumulative[:-4]) / 4
+        with np.errstate(divide="ignore"):
+            block_loudness = -0.691 + 10 * np.log10(block_energies)
+        gated = block_energies[block_loudness > -70.0]
+        if len(gated):
+            relative_gate = -0.691 + 10 * np.log10(gated.mean()) - 10.0
+            gated = block_energies[(block_loudness > -70.0) & (block_loudness > relative_gate)]
+            integrated_loudness = round(float(-0.691 + 10 * np.log10(gated.mean())), 2)
+
+    sample_count = info.frame_count * info.channels
+    return {
+        "integrated_lufs": integrated_loudness,
+        "true_peak_dbtp": to_decibels(true_peak),
+        "sample_peak_dbfs": to_decibels(sample_peak),
+        "rms_dbfs": to_decibels(sum_of_squares / sample_count, power=True) if sample_count else None,
+        "clipped_samples": clipped_samples,
+    }
 
-    ini_filepath = os.path.join(source_dir, config_filename)
-    Config = configparser.ConfigParser()
-    Config.read_file(open(ini_filepath))
+# Helper function that analyses every print side by side, numpy releases the GIL for the heavy lifting so threads are enough
+def analyse_prints(prints: dict, workers: int = 0) -> dict:
+    """
+    Runs analyse_wav on every print in prints ({print name: wav path}).
+    Returns a dictionary mapping each print name to its analysis, or to {"error": message} if it couldn't be analysed.
+    Returns an empty dictionary if numpy isn't installed.
+    """
+    try:
+        import numpy # noqa: F401, only checking that it is installed
+    except ImportError:
+        print("numpy is not installed, skipping the audio analysis. Install it with 'pip install numpy'")
+        return {}
+    from concurrent.futures import ThreadPoolExecutor
+    if not prints:
+        return {}
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(prints))) as pool:
+        futures = {name: pool.submit(analyse_wav, wav_path) for name, wav_path in prints.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except (OSError, ValueError) as error:
+                results[name] = {"error": str(error)}
+    return results
+
+# Helper function to check whether a .wav print is silent all the way through, e.g. an empty print left behind by Ableton
+def is_silent_wav(wav_path, threshold_db: float, window_seconds: float = SILENCE_WINDOW_SECONDS) -> bool:
+    """
+    Returns True if no window_seconds long window of the print has an RMS level above threshold_db dBFS on any channel.
+    The scan stops at the first window above the threshold, so only silent prints are read to the end,
+    and blocks whose peak is below the threshold are passed over without working out their RMS. Requires numpy.
+    """
+    import numpy as np
+    info = probe_wav(wav_path)
+    window = max(1, round(info.sample_rate * window_seconds))
+    threshold = 10 ** (threshold_db / 10) # As a mean square
+    for block in iter_wav_blocks(wav_path, block_frames=window * 64, info=info):
+        # No window can be louder than the block's peak
+        if float(np.abs(block).max(initial=0.0)) ** 2 <= threshold:
+            continue
+        squares = np.square(block)
+        whole_frames = len(block) - len(block) % window
+        mean_squares = squares[:whole_frames].reshape(-1, window, info.channels).mean(axis=1)
+        if (mean_squares > threshold).any():
+            return False
+        # Only the last block of the print can end with a shorter window
+        if whole_frames < len(block) and (squares[whole_frames:].mean(axis=0) > threshold).any():
+            return False
+    return True
 
-    if 'Song Details' not in Config:
-        print(f"\nNo 'Song Details' section found in {config_filename}. Stopping Bouncer Process \n")
-        EXIT = input("Press Enter to exit script")
-        raise SystemExit(1)
+# Helper function to find the silent prints among the stems before any of them is encoded
+def find_silent_stems(prints: dict, threshold_db: float, workers: int = 0) -> list:
+    """
+    Runs is_silent_wav on every print in prints ({print name: wav path}) and returns the names of the silent ones.
+    Returns an empty list if numpy isn't installed, a print that can't be read is never counted as silent.
+    """
+    try:
+        import numpy # noqa: F401, only checking that it is installed
+    except ImportError:
+        print("numpy is not installed, skipping the silent stem check. Install it with 'pip install numpy'")
+        return []
+    from concurrent.futures import ThreadPoolExecutor
+    if not prints:
+        return []
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    silent_stems = []
+    with ThreadPoolExecutor(max_workers=min(workers, len(prints))) as pool:
+        futures = {name: pool.submit(is_silent_wav, wav_path, threshold_db) for name, wav_path in prints.items()}
+        for name, future in futures.items():
+            try:
+                if future.result():
+                    silent_stems.append(name)
+                    print(f"{name} is silent (below {threshold_db:g} dBFS), it won't be exported")
+            except (OSError, ValueError) as error:
+                print(f"Could not check whether {name} is silent: {error}")
+    return silent_stems
+
+# Helper function to parse the silenceThreshold option, a level in dBFS or none to export every stem
+def parse_silence_threshold(text: str):
+    """Returns the threshold in dBFS, or None when the check is turned off. Raises ValueError for anything else."""
+    if text.strip().lower() in ("none", "off", ""):
+        return None
+    try:
+        threshold_db = float(text.strip().lower().removesuffix("dbfs").removesuffix("db"))
+    except ValueError:
+        raise ValueError(f"silenceThreshold must be a level in dBFS such as -70, or none, not '{text}'") from None
+    if threshold_db > 0:
+        raise ValueError(f"silenceThreshold must be at or below 0 dBFS, not {threshold_db:g}")
+    return threshold_db
+
+# Helper function to describe the analysis of one print on a single line of the release note
+def format_analysis(analysis: dict) -> str:
+    if "error" in analysis:
+        return f"could not be analysed ({analysis['error']})"
+    def level(value, unit):
+        return f"{value:.1f} {unit}" if value is not None else f"-inf {unit}"
+    return (f"{level(analysis['integrated_lufs'], 'LUFS')}, true peak {level(analysis['true_peak_dbtp'], 'dBTP')}, "
+            f"RMS {level(analysis['rms_dbfs'], 'dBFS')}, {analysis['clipped_samples']} clipped samples")
+
+# Helper function to parse the mixGroups option into the stem prints summed into each group
+def parse_mix_groups(text: str, stem_prefixes: list) -> dict:
+    """
+    Parses e.g. 'INSTRUMENTAL = all - VOCALS; DRUMS AND BASS = DRUMS + BASS' into {group name: [stem print prefixes]}.
+    Groups are separated by semicolons, 'all' is every stem print except the master and ' PRINT' can be left off.
+    Group names name the exported files, so characters that can't be used in a filename are replaced with '-'.
+    Returns an empty dictionary for 'none'. Raises ValueError for an unknown stem print or a group with nothing in it.
+    """
+    groups = {}
+    if text.strip().lower() in ("", "none"):
+        return groups
+    prefixes = {prefix.lower(): prefix for prefix in stem_prefixes}
+    every_stem = [prefix for prefix in stem_prefixes if prefix != StemTypes.MASTER.value]
+    for entry in text.split(";"):
+        if not entry.strip():
+            continue
+        name, separator, expression = entry.partition("=")
+        # Leading dots would hide the files and trailing ones are dropped by Windows
+        name = format_for_filename(name.strip()).strip(". ")
+        if not separator or not name:
+            raise ValueError(f"Mix group '{entry.strip()}' in mixGroups must be written as NAME = stems")
+        if name.lower() in prefixes or name in groups:
+            raise ValueError(f"The mix group name '{name}' is already used by a stem print or another mix group")
+        # Operators need spaces around them, so stem prints with a hyphen in their name still work
+        terms = re.split(r"\s+([+-])\s+", expression.strip())
+        members = []
+        for operator, term in zip(["+"] + terms[1::2], terms[0::2]):
+            term = term.strip().lower()
+            if term == "all":
+                stems = every_stem
+            elif term in prefixes or f"{term} print" in prefixes:
+                stems = [prefixes.get(term) or prefixes[f"{term} print"]]
+            else:
+                raise ValueError(f"Unknown stem print '{term.upper()}' in the mix group '{name}'")
+            members = [stem for stem in members if stem not in stems] if operator == "-" else \
+                members + [stem for stem in stems if stem not in members]
+        if not members:
+            raise ValueError(f"The mix group '{name}' doesn't contain any stem prints")
+        groups[name] = members
+    return groups
+
+# Helper function for the header of a plain PCM .wav file, or an RF64 one when its audio is 4 GB or more
+def wav_header(sample_rate: int, channels: int, bit_depth: int, data_size: int) -> bytes:
+    block_align = channels * bit_depth // 8
+    fmt = struct.pack("<4sIHHIIHH", b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, bit_depth)
+    if data_size + 36 < RF64_SIZE_PLACEHOLDER:
+        return struct.pack("<4sI4s", b"RIFF", 36 + data_size + (data_size & 1), b"WAVE") + fmt + \
+            struct.pack("<4sI", b"data", data_size)
+    ds64 = struct.pack("<4sIQQQI", b"ds64", 28, 72 + data_size + (data_size & 1), data_size, data_size // block_align, 0)
+    return struct.pack("<4sI4s", b"RF64", RF64_SIZE_PLACEHOLDER, b"WAVE") + ds64 + fmt + \
+        struct.pack("<4sI", b"data", RF64_SIZE_PLACEHOLDER)
+
+# Helper function that sums stem prints into a new print, e.g. an instrumental from every stem but the vocals
+def render_mix_group(stem_paths: list, output_path, ceiling_db: float = MIX_GROUP_CEILING_DB,
+                     block_frames: int = 65536) -> dict:
+    """
+    Every print is read a block at a time through a numpy memmap and decoded to the same float scale, whatever its
+    bit depth, so the sum is gain aligned with the mix it was printed from. Mono prints are spread over every channel
+    and shorter prints are padded with silence. The first pass only measures the peak of the sum, the second writes
+    it, turned down if needed so it peaks at ceiling_db instead of clipping. The render is 16 bit if every print is,
+    otherwise 24 bit. Only two blocks of audio are in memory at a time, however long the prints are.
+    Returns {"peak_db": peak of the sum, "gain_db": gain applied to it}. Raises ValueError if the prints can't be summed.
+    Requires numpy.
+    """
+    import numpy as np
+    infos = [probe_wav(stem_path) for stem_path in stem_paths]
+    sample_rate, channels = infos[0].sample_rate, max(info.channels for info in infos)
+    for stem_path, info in zip(stem_paths, infos):
+        if info.sample_rate != sample_rate:
+            raise ValueError(f"{os.path.basename(stem_path)} is at {info.sample_rate} Hz, "
+                             f"the other prints in the mix group are at {sample_rate} Hz")
+        if info.channels not in (1, channels):
+            raise ValueError(f"{os.path.basename(stem_path)} has {info.channels} channels, which can't be summed "
+                             f"with {channels} channel prints")
+    frame_count = max(info.frame_count for info in infos)
+    prints = [(np.memmap(stem_path, dtype=np.uint8, mode="r", offset=info.data_offset,
+                         shape=(info.frame_count * info.block_align,)), info)
+              for stem_path, info in zip(stem_paths, infos) if info.frame_count]
+
+    def mixed_blocks():
+        for start in range(0, frame_count, block_frames):
+            block = np.zeros((min(block_frames, frame_count - start), channels), dtype=np.float32)
+            for raw, info in prints:
+                stop = min(start + len(block), info.frame_count)
+                if stop > start:
+                    block[:stop - start] += decode_wav_samples(raw[start * info.block_align:stop * info.block_align], info)
+            yield block
+
+    peak = max((float(np.abs(block).max()) for block in mixed_blocks()), default=0.0)
+    ceiling = 10 ** (ceiling_db / 20)
+    gain = ceiling / peak if peak > ceiling else 1.0
+    bit_depth = 16 if all(info.bit_depth == 16 and info.format_tag != WAVE_FORMAT_IEEE_FLOAT for info in infos) else 24
+    full_scale = float(2 ** (bit_depth - 1))
+    data_size = frame_count * channels * bit_depth // 8
+    with open(output_path, "wb") as output_file:
+        output_file.write(wav_header(sample_rate, channels, bit_depth, data_size))
+        for block in mixed_blocks():
+            samples = np.clip(np.rint(block * (gain * full_scale)), -full_scale, full_scale - 1).astype("<i4")
+            if bit_depth == 16:
+                output_file.write(samples.astype("<i2").tobytes())
+            else:
+                # The low three bytes of each little endian 32 bit sample are its 24 bit sample
+                output_file.write(samples.view(np.uint8).reshape(-1, 4)[:, :3].tobytes())
+        if data_size & 1:
+            output_file.write(b"\0")
+    return {"peak_db": to_decibels(peak), "gain_db": to_decibels(gain)}
+
+# Helper function that renders every mix group side by side into render_dir, returning {group name: render path}
+def render_mix_groups(mix_groups: dict, stems_index: dict, render_dir) -> dict:
+    """
+    mix_groups is from parse_mix_groups, the stem prints of each group are looked up in stems_index and any
+    without a print are left out. The renders are hidden files, remove them once they have been exported.
+    A group that can't be rendered is reported and left out of the result.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    try:
+        import numpy # noqa: F401
+    except ImportError:
+        print("numpy is not installed, skipping the mix groups. Install it with 'pip install numpy'")
+        return {}
+    jobs = {}
+    for name, stems in mix_groups.items():
+        stem_paths = [stems_index[stem] for stem in stems if stems_index.get(stem)]
+        if stem_paths:
+            jobs[name] = stem_paths
+        else:
+            print(f"None of the stem prints in the mix group {name} were found, skipping it")
+    if not jobs:
+        return {}
+    render_paths = {name: os.path.join(render_dir, f".{name}.render.wav") for name in jobs}
+    # numpy lets go of the GIL while it decodes and sums, so the groups are rendered on threads
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        renders = {name: pool.submit(render_mix_group, stem_paths, render_paths[name]) for name, stem_paths in jobs.items()}
+        for name, render in renders.items():
+            try:
+                levels = render.result()
+                turned_down = f", turned down {-levels['gain_db']} dB so it doesn't clip" if levels["gain_db"] else ""
+                print(f"Rendered the mix group {name} from {len(jobs[name])} stem print{'s' if len(jobs[name]) > 1 else ''}{turned_down}")
+            except (OSError, ValueError, struct.error) as error:
+                print(f"Could not render the mix group {name}: {error}")
+                render_path = render_paths.pop(name)
+                if os.path.exists(render_path):
+                    os.remove(render_path)
+    return render_paths
+
+# Min/max waveform peaks of a print at a few zoom levels, for the showcase player to draw without decoding the mp3
+class WaveformPeaks:
+    """
+    Collects the peaks from the raw bytes of the print as they are streamed to the encoder (add_bytes),
+    or from decoded sample blocks (add_samples). The channels are folded into one and each pixel of the finest
+    zoom level holds the min and max of its frames, the coarser levels are reduced from it when the peaks are written.
+    The sidecar is in the audiowaveform json layout (version 2, 8 bit data) at the finest zoom level, the coarser
+    zoom levels are listed under "levels" in the same layout, which audiowaveform readers ignore. Requires numpy.
+    """
+    def __init__(self, info: WavInfo, zoom_levels: tuple = WAVEFORM_ZOOM_LEVELS):
+        import numpy as np
+        self.info = info
+        self.zoom_levels = sorted(zoom_levels)
+        self.position = 0 # Bytes of the file seen so far by add_bytes
+        self.partial_frame = b""
+        self.pending = np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32) # Frames short of a whole pixel
+        self.minimums, self.maximums = [], []
+        self.frames_seen = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.frames_seen >= self.info.frame_count
+
+    def add_bytes(self, chunk: bytes):
+        """Takes the next chunk of the file from its very first byte, the header is skipped."""
+        data_start, data_end = self.info.data_offset, self.info.data_offset + self.info.data_size
+        start, end = max(self.position, data_start), min(self.position + len(chunk), data_end)
+        self.position += len(chunk)
+        if start >= end:
+            return
+        audio = self.partial_frame + chunk[start - (self.position - len(chunk)):end - (self.position - len(chunk))]
+        whole_bytes = len(audio) - len(audio) % self.info.block_align
+        self.partial_frame = audio[whole_bytes:]
+        if whole_bytes:
+            self.add_samples(decode_wav_samples(audio[:whole_bytes], self.info))
+
+    def add_samples(self, block):
+        import numpy as np
+        self.frames_seen += len(block)
+        pixel = self.zoom_levels[0]
+        minimums = np.concatenate((self.pending[0], block.min(axis=1)))
+        maximums = np.concatenate((self.pending[1], block.max(axis=1)))
+        whole_pixels = len(minimums) // pixel
+        if whole_pixels:
+            self.minimums.append(minimums[:whole_pixels * pixel].reshape(whole_pixels, pixel).min(axis=1))
+            self.maximums.append(maximums[:whole_pixels * pixel].reshape(whole_pixels, pixel).max(axis=1))
+        self.pending = minimums[whole_pixels * pixel:], maximums[whole_pixels * pixel:]
+
+    def to_dict(self) -> dict:
+        import numpy as np
+        # The frames left over at the end make up one last, shorter pixel, a print with no frames has no pixels at all
+        empty = [np.zeros(0, dtype=np.float32)]
+        minimums = np.concatenate(empty + self.minimums + ([self.pending[0].min(keepdims=True)] if len(self.pending[0]) else []))
+        maximums = np.concatenate(empty + self.maximums + ([self.pending[1].max(keepdims=True)] if len(self.pending[1]) else []))
+        levels = []
+        for samples_per_pixel in self.zoom_levels:
+            factor = samples_per_pixel // self.zoom_levels[0]
+            padding = -len(minimums) % factor
+            level_minimums = np.pad(minimums, (0, padding), mode="edge").reshape(-1, factor).min(axis=1) if len(minimums) else minimums
+            level_maximums = np.pad(maximums, (0, padding), mode="edge").reshape(-1, factor).max(axis=1) if len(maximums) else maximums
+            data = np.empty(2 * len(level_minimums), dtype=np.int8)
+            data[0::2] = np.clip(np.round(level_minimums * 127), -128, 127)
+            data[1::2] = np.clip(np.round(level_maximums * 127), -128, 127)
+            levels.append({"version": 2, "channels": 1, "sample_rate": self.info.sample_rate,
+                           "samples_per_pixel": samples_per_pixel, "bits": 8, "length": len(level_minimums),
+                           "data": data.tolist()})
+        return dict(levels[0], levels=levels[1:])
+
+    def write(self, path):
+        atomic_write_text(path, json.dumps(self.to_dict(), separators=(",", ":")))
+        return path
 
-    if 'Metadata' not in Config:
-        print(f"\nNo 'Metadata' section found in {config_filename}. Stopping Bouncer Process \n")
-        EXIT = input("Press Enter to exit script")
-        raise SystemExit(1)
+# Helper function to create a new entry in the release notes directory
+def create_release_note(source_dir, config: ProjectConfig,
+                        non_standard_time_signature: bool = False,
+                        custom_comments_flag: bool = True,
+                        interactive: bool = True,
+                        comments: str = None,
+                        report: BounceReport = None,
+                        analysis_future = None,
+                        catalog = None,
+                        silent_stems: list = None):
+    # Checking the config and creating release notes directory if not already created
+    if not config.has_section('Song Details'):
+        print(f"\nNo 'Song Details' section found in {CONFIGFILE_NAME}. Stopping Bouncer Process \n")
+        stop_bouncer(interactive)
+
+    if not config.has_section('Metadata'):
+        print(f"\nNo 'Metadata' section found in {CONFIGFILE_NAME}. Stopping Bouncer Process \n")
+        stop_bouncer(interactive)
     release_notes_dir = os.path.join(source_dir, "release_notes")
     if not os.path.exists(release_notes_dir):
         os.makedirs(release_notes_dir)
 
     # Based on config file we create a new txt file with a file name of form v Version + date
-    release_note_filename = f"Release Notes v{Config['Metadata']['Version']} {Config['Metadata']['Current Date of Version']}.txt"
-
-    release_note_filepath = os.path.join(release_notes_dir, release_note_filename)
-    comments = "None" # Initialise the Release Comments Variable for file_content
-    if custom_comments_flag:
+    release_note_filepath = get_release_note_path(source_dir, config)
+    if comments is not None:
+        # Comments given up front, e.g. on the command line, replace the Release Comments Pop up Ui
+        print(f"\nComments for this release note:\n {comments}\n")
+    elif custom_comments_flag and interactive:
         print("Would you like to add a comment to this note? Please enter it in the Release Comments Pop up Ui. Press the Save Comments button once you have finished")
-        comments = custom_comments_ui()
+        if report:
+            with report.phase("Comments dialog"):
+                comments = custom_comments_ui()
+        else:
+            comments = custom_comments_ui()
         if comments:
             print(f"\nComments for this release note:\n {comments}\n")
+    comments = comments or "None"
+    # Only wait for the background audio analysis once the comments have been typed
+    analysis = None
+    if analysis_future is not None:
+        with report.phase("Audio analysis") if report else contextlib.nullcontext():
+            analysis = analysis_future.result()
 
     # Create the content for the file
     file_content = (
         f"Song Details:\n"
-        f"Date of Version: {Config['Metadata']['Current Date of Version']}\n"
-        f"Artist: {Config['Song Details']['Artist']}\n"
-        f"Song Name: {Config['Song Details']['Song Name']}\n"
-        f"Genre Abbreviation: {Config['Song Details']['Genre Abbreviation']}\n"
-        f"BPM: {Config['Song Details']['BPM']}\n"
-        f"Song Duration in Seconds: {Config['Song Details']['Duration']}\n"
-        f"Sample Rate in Hertz: {Config['Metadata']['Sample Rate']}\n"
-        f"Key Signature: {Config['Song Details']['Key']}\n"
-        + (f"Time Signature: {Config['Song Details']['Time Signature']}\n"
+        f"Date of Version: {config.current_date}\n"
+        f"Artist: {config.artist}\n"
+        f"Song Name: {config.song_name}\n"
+        f"Genre Abbreviation: {config.genre_abbreviation}\n"
+        f"BPM: {config.bpm}\n"
+        f"Song Duration in Seconds: {config.duration}\n"
+        f"Sample Rate in Hertz: {config.sample_rate}\n"
+        f"Bit Depth: {config.bit_depth}\n"
+        f"Channels: {config.channels}\n"
+        f"Key Signature: {config.key}\n"
+        + (f"Time Signature: {config.time_signature}\n"
            if non_standard_time_signature else "")
         + f"Comments: {comments}\n"
     )
+    # Stems left out of the POST entry because they were silent, see find_silent_stems
+    if silent_stems:
+        file_content += f"\nSilent Stems (not exported): {', '.join(silent_stems)}\n"
+
+    # The loudness and peak levels of every print, see analyse_wav
+    if analysis:
+        file_content += "\nAudio Analysis:\n" + "".join(f"{name}: {format_analysis(result)}\n"
+                                                        for name, result in analysis.items())
 
     # Write the content to the text file
-    with open(release_note_filepath, 'w') as file:
-        file.write(file_content)
+    atomic_write_text(release_note_filepath, file_content)
 
     print(f"Song details saved to {os.path.basename(release_note_filepath)}")
+    # The version is searchable in the release catalog from here on, see ReleaseCatalog
+    if catalog:
+        catalog.record_version(source_dir, config)
     return release_note_filepath
 
-# Helper function that creates a POST directory to store the version based deliverables folders that will be sent to clients
-def generate_POST(source_dir, directory, release_note_filepath,
-                  config_filename=CONFIGFILE_NAME, stem_types: StemTypes = StemTypes,
-                  consolidate_sel: bool = True, alp_dir_flag: bool = False):
-    # Initialising configParser file and creating release notes directory if not already created
-    ini_filepath = os.path.join(source_dir, config_filename)
-    Config = configparser.ConfigParser()
-    Config.read_file(open(ini_filepath))
-
-    if 'Song Details' not in Config:
-        raise KeyError(f"No 'Song Details' section found in {config_filename}.")
-    if 'Metadata' not in Config:
-        raise KeyError(f"No 'Metadata' section found in {config_filename}.")
+# Helper function to get the folder of the POST entry for the current version in the config.ini
+def get_post_entry_dir(source_dir, config: ProjectConfig) -> str:
+    return os.path.join(source_dir, "POST", f"[[{format_for_filename(config.artist, artistsFlag=True)}] - [{format_for_filename(config.song_name)}]] v{config.version} {config.current_date}")
+
+# Helper function to get the path of the release note of the current version in the config.ini
+def get_release_note_path(source_dir, config: ProjectConfig) -> str:
+    return os.path.join(source_dir, "release_notes", f"Release Notes v{config.version} {config.current_date}.txt")
+
+# Helper function to turn a DD-MM-YYYY date of a version into YYYY-MM-DD, which sorts and compares as text, or None
+def to_iso_date(date: str):
+    try:
+        return datetime.strptime(date.strip(), "%d-%m-%Y").strftime("%Y-%m-%d")
+    except (AttributeError, ValueError):
+        return None
+
+# Helper function to read a number from the config.ini or a release note, None for N/A and other placeholders
+def to_number(value: str):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+# Helper function to get the path of the release catalog of a project, set with catalogPath or kept in its parent folder
+def get_catalog_path(project_dir, config: ProjectConfig = None) -> str:
+    catalog_path = config.catalog_path if config else ""
+    if catalog_path and os.path.isdir(catalog_path):
+        catalog_path = os.path.join(catalog_path, CATALOG_NAME)
+    return catalog_path or os.path.join(os.path.dirname(os.path.abspath(project_dir)), CATALOG_NAME)
+
+# SQLite catalog of every bounced version across the projects that share it
+class ReleaseCatalog:
+    """
+    Holds one row per version of every project, keyed by project folder and version, so versions can be searched
+    by BPM, key, date or artist without reading every release note and config.ini.
+    Rows are written by create_release_note and increment_version, or rebuilt from the project folders by rebuild_catalog.
+    Several bounces can write to the same catalog at once, SQLite locks it and each write waits up to LOCK_TIMEOUT_SECONDS.
+    """
+    COLUMNS = ("project_dir", "version", "song_id", "date", "artist", "song_name", "bpm", "key", "time_signature",
+               "duration", "sample_rate", "showcase_path", "post_dir", "release_note_path", "released", "updated_at")
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS versions (
+            project_dir TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            song_id TEXT,
+            date TEXT, -- YYYY-MM-DD
+            artist TEXT COLLATE NOCASE,
+            song_name TEXT COLLATE NOCASE,
+            bpm REAL,
+            key TEXT COLLATE NOCASE,
+            time_signature TEXT,
+            duration REAL,
+            sample_rate INTEGER,
+            showcase_path TEXT,
+            post_dir TEXT,
+            release_note_path TEXT,
+            released INTEGER NOT NULL DEFAULT 0, -- 1 once the bounce of the version has finished
+            updated_at TEXT,
+            PRIMARY KEY (project_dir, version)
+        );
+        CREATE INDEX IF NOT EXISTS versions_key_bpm_date ON versions (key, bpm, date);
+        CREATE INDEX IF NOT EXISTS versions_bpm_date ON versions (bpm, date);
+        CREATE INDEX IF NOT EXISTS versions_date ON versions (date);
+        CREATE INDEX IF NOT EXISTS versions_artist ON versions (artist);
+        CREATE INDEX IF NOT EXISTS versions_song_id ON versions (song_id, version);
+    """
+    # Filters accepted by find -> SQL condition
+    FILTERS = {"song_id": "song_id = ?", "artist": "artist = ?", "song": "song_name = ?", "bpm": "bpm = ?",
+               "key": "key = ?", "since": "date >= ?", "until": "date <= ?"}
+
+    def __init__(self, path):
+        import sqlite3
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=LOCK_TIMEOUT_SECONDS)
+        self.connection.row_factory = sqlite3.Row
+        try:
+            # Readers never block the bounce that is writing in write ahead log mode
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(self.SCHEMA)
+        except BaseException:
+            self.connection.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def upsert(self, rows: list):
+        """Inserts or updates rows (dictionaries of COLUMNS), a column given as None keeps the value already stored."""
+        columns = ", ".join(self.COLUMNS)
+        placeholders = ", ".join(f":{column}" for column in self.COLUMNS)
+        updates = ", ".join(f"{column} = COALESCE(excluded.{column}, {column})" for column in self.COLUMNS[2:]
+                            if column != "released")
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO versions ({columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT (project_dir, version) DO UPDATE SET {updates}, released = MAX(released, excluded.released)",
+                [dict({column: None for column in self.COLUMNS}, updated_at=datetime.now().isoformat(timespec="seconds"),
+                      **row) for row in rows])
+
+    def record_version(self, source_dir, config: ProjectConfig, released: bool = False):
+        """
+        Writes the row of the current version in the config.ini, with the paths of its release note, showcase master and
+        POST entry as far as they exist yet. The catalog is only an index, so a failed write is reported and not raised.
+        """
+        import sqlite3
+        source_dir = os.path.abspath(source_dir)
+        release_note_path = get_release_note_path(source_dir, config)
+        post_dir = get_post_entry_dir(source_dir, config)
+        row = {"project_dir": source_dir, "version": config.version, "song_id": config.song_id,
+               "date": to_iso_date(config.current_date), "artist": config.artist, "song_name": config.song_name,
+               "bpm": to_number(config.bpm), "key": config.key, "time_signature": config.time_signature,
+               "duration": to_number(config.duration), "sample_rate": to_number(config.sample_rate),
+               "showcase_path": find_showcase_master(config.showcase_dir, config.song_id, config.version),
+               "post_dir": post_dir if os.path.isdir(post_dir) else None,
+               "release_note_path": release_note_path if os.path.exists(release_note_path) else None,
+               "released": int(released)}
+        try:
+            self.upsert([row])
+            # Publishing a version removes the showcase masters of the previous ones unless saveMasterEditions is set
+            stale_rows = [(stored["version"],) for stored in self.connection.execute(
+                              "SELECT version, showcase_path FROM versions WHERE project_dir = ? AND showcase_path IS NOT NULL",
+                              (source_dir,)) if not os.path.exists(stored["showcase_path"])]
+            with self.connection:
+                self.connection.executemany("UPDATE versions SET showcase_path = NULL WHERE project_dir = ? AND version = ?",
+                                            [(source_dir, version) for version, in stale_rows])
+        except sqlite3.Error as error:
+            print(f"Could not update the release catalog {self.path}: {error}")
+
+    def find(self, **filters) -> list:
+        """
+        Returns the rows matching every filter as dictionaries, newest first. Filters are song_id, artist, song, bpm, key
+        and since/until as DD-MM-YYYY dates, text is matched without case. Raises ValueError for anything else.
+        """
+        conditions, values = [], []
+        for name, value in filters.items():
+            if name not in self.FILTERS:
+                raise ValueError(f"Unknown catalog filter '{name}', use one of {', '.join(self.FILTERS)}")
+            if name in ("since", "until"):
+                value = to_iso_date(value)
+                if value is None:
+                    raise ValueError(f"The {name} filter takes a DD-MM-YYYY date")
+            elif name == "bpm":
+                value = to_number(value)
+                if value is None:
+                    raise ValueError("The bpm filter takes a number")
+            conditions.append(self.FILTERS[name])
+            values.append(value)
+        query = "SELECT * FROM versions" + (f" WHERE {' AND '.join(conditions)}" if conditions else "")
+        return [dict(row) for row in self.connection.execute(query + " ORDER BY date DESC, song_id, version DESC", values)]
+
+# Helper function to find the published showcase master of one version of a song, None if it isn't in the showcase folder
+def find_showcase_master(showcase_dir, song_id, version: int):
+    if not showcase_dir or not song_id or not os.path.isdir(showcase_dir):
+        return None
+    for path in ShowcaseManifest(showcase_dir).load().files(song_id):
+        match = SHOWCASE_FILENAME_PATTERN.match(os.path.basename(path))
+        # The first published file of a version is the master in the first output profile, the rest are sidecars
+        if match and int(match["version"]) == version and not path.endswith(".peaks.json") and os.path.exists(path):
+            return path
+    return None
+
+# The deliverable ZIP archive of a POST entry, filled in while the stems are still being encoded
+class PostPackage:
+    """
+    Written as POST/<entry name>.zip, every file sits under the entry name inside it, alongside a SHA256SUMS manifest.
+    Each file is added as soon as it is complete, reading it once for both the archive and its checksum, so the
+    archive is finished moments after the last stem. Audio is stored as it is since it is already compressed.
+    The archive is written under a .part name and only renamed once close has added the last file.
+    """
+    def __init__(self, post_dir):
+        self.post_dir = post_dir
+        self.path = post_dir + ".zip"
+        self.part_path = get_part_path(self.path)
+        self.root = os.path.basename(post_dir)
+        self.checksums = {}
+        self.lock = threading.Lock()
+        os.makedirs(post_dir, exist_ok=True)
+        import zipfile
+        self.archive = zipfile.ZipFile(self.part_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True)
+
+    def arcname(self, file_path) -> str:
+        return os.path.relpath(file_path, self.post_dir).replace(os.sep, "/")
+
+    def add(self, file_path):
+        """Adds a finished file of the POST entry to the archive, a file already in it is left as it is."""
+        import hashlib
+        import zipfile
+        name = self.arcname(file_path)
+        with self.lock:
+            if name in self.checksums:
+                return
+            info = zipfile.ZipInfo.from_file(file_path, f"{self.root}/{name}")
+            info.compress_type = zipfile.ZIP_STORED if os.path.splitext(file_path)[1].lower() in PACKAGE_STORED_EXTENSIONS \
+                else zipfile.ZIP_DEFLATED
+            digest = hashlib.sha256()
+            buffer = bytearray(STREAM_CHUNK_SIZE)
+            view = memoryview(buffer)
+            with open(file_path, "rb", buffering=0) as source_file, self.archive.open(info, "w") as entry:
+                for size in iter(lambda: source_file.readinto(buffer), 0):
+                    digest.update(view[:size])
+                    entry.write(view[:size])
+            self.checksums[name] = digest.hexdigest()
+
+    def close(self) -> str:
+        """Adds every file of the POST entry that isn't in the archive yet and the SHA256SUMS manifest, returns the archive path."""
+        for dir_path, dir_names, file_names in os.walk(self.post_dir):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                if not file_name.startswith("."):
+                    self.add(os.path.join(dir_path, file_name))
+        with self.lock:
+            manifest = "".join(f"{digest}  {name}\n" for name, digest in sorted(self.checksums.items()))
+            self.archive.writestr(f"{self.root}/SHA256SUMS", manifest)
+            self.archive.close()
+        os.replace(self.part_path, self.path)
+        return self.path
+
+    def discard(self):
+        """Closes and removes an unfinished archive."""
+        with self.lock:
+            self.archive.close()
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+# Helper function that creates the POST entry and starts collecting the stems into it on a background thread
+def start_POST(source_dir, directory,
+               config: ProjectConfig, stem_types: StemTypes = StemTypes,
+               consolidate_sel: bool = True, alp_dir_flag: bool = False,
+               export_workers: int = 0, streaming_export: bool = True,
+               stems_index: dict = None, bounce_cache: BounceCache = None,
+               report: BounceReport = None, output_profiles: list = DEFAULT_OUTPUT_PROFILES,
+               object_store: ObjectStore = None, journal: BounceJournal = None,
+               encoder_backend: str = "ffmpeg", package: PostPackage = None, mix_groups: dict = None):
+    """
+    Creates the POST entry for the current version and exports its stems in the background,
+    so the encoding carries on while the master is copied and the release comments are typed.
+    Each stem is added to package, if given, as soon as it is in the STEMS folder.
+    Every group in mix_groups (see parse_mix_groups) is rendered from the stem prints while they export and exported
+    after them, unless the cache already holds its files for the same prints.
+    Returns a Future that resolves to the stem export results, pass it to finish_POST once the release note is written.
+    """
+    # Checking the config and creating the POST directory if not already created
+    if not config.has_section('Song Details'):
+        raise KeyError(f"No 'Song Details' section found in {CONFIGFILE_NAME}.")
+    if not config.has_section('Metadata'):
+        raise KeyError(f"No 'Metadata' section found in {CONFIGFILE_NAME}.")
 
     posts_dir = os.path.join(source_dir, "POST")
     if not os.path.exists(posts_dir):
         os.makedirs(posts_dir)
 
     # Within the POST dir, there will be sub folders housing each post
-    song_name = Config['Song Details']['Song Name']
-    song_artist = Config['Song Details']['Artist']
-    post_dir = os.path.join(posts_dir, f"[[{format_for_filename(song_artist, artistsFlag=True)}] - [{format_for_filename(song_name)}]] v{Config['Metadata']['Version']} {Config['Metadata']['Current Date of Version']}")
+    post_dir = get_post_entry_dir(source_dir, config)
 
     if not os.path.exists(post_dir):
         os.makedirs(post_dir)
+    # Helper function to add the finished files of a stem to the package
+    def add_to_package(output_paths: list):
+        for output_path in output_paths:
+            package.add(output_path)
+
     # Helper function to create collect all of the necessary stems for the project into the stems folder
     def collect_stems(parent_dir, directory, StemType: StemTypes,
                       cons_sel: bool=consolidate_sel, sd_flag:bool=alp_dir_flag):
@@ -455,112 +2480,234 @@ def generate_POST(source_dir, directory, release_note_filepath,
         if not os.path.exists(stems_dir):
             os.makedirs(stems_dir)
 
-        # Search through the ALP directory for the latest editions of each stem
-        # Copy each stem into this STEMS directory
-        for type in (StemType):
+        # Search through the ALP directory for the latest editions of each stem, scanning it only once
+        index = stems_index
+        if index is None:
+            index = build_stems_index(directory, [type.value for type in StemType], cons_sel, sd_flag)
+        prints = {}
+        for stem_print in index:
             stem_path = get_latest_stems_print(directory, consolidate_sel=cons_sel,
-                                               alp_dir_flag = sd_flag, stems_print=type.value)
-            # Construct the new filename
+                                               alp_dir_flag = sd_flag, stems_print=stem_print,
+                                               stems_index=index)
             if stem_path is not None:
-                new_filename = f'{type.value}.mp3'
-
-                stem_track = AudioSegment.from_file(stem_path, format="wav")
-
-                file_handle = stem_track.export(os.path.join(stems_dir, new_filename),
-                                              format="mp3",
-                                              bitrate="192k")
-
-                print(f"Exported {new_filename} into STEMS folder\n")
-
-    # perform the collect stems function
-    collect_stems(parent_dir=post_dir, directory=directory, StemType=stem_types)
+                prints[stem_print] = stem_path
+        # Helper function that links the outputs of a print that haven't changed since a previous version,
+        # returning the ones that still have to be encoded
+        def reuse_outputs(stem_print, stem_path, outputs: list, source_hash: str = None) -> list:
+            reuse_start = time.perf_counter()
+            reused, pending = reuse_cached_outputs(stem_path, outputs, bounce_cache, source_hash=source_hash)
+            if journal and reused:
+                journal.record_exports(stem_path, reused)
+            if reused:
+                print(f"{stem_print} is unchanged, reused {', '.join(map(os.path.basename, reused))} from a previous version")
+                if package:
+                    add_to_package(reused)
+            if not pending and report and stem_path:
+                report.add_export(stem_print, export_stats(stem_path, reused, "reused", time.perf_counter() - reuse_start))
+            return pending
+
+        export_jobs = {}
+        for stem_print, stem_path in prints.items():
+            # Construct the new filename
+            outputs = get_output_paths(os.path.join(stems_dir, stem_print), output_profiles)
+            # Stems already exported by an interrupted run of this version are left as they are
+            if journal:
+                outputs = [output for output in outputs if not journal.is_exported(stem_path, output[0])]
+                if not outputs:
+                    print(f"{stem_print} was already exported before the last bounce stopped")
+                    continue
+            pending = reuse_outputs(stem_print, stem_path, outputs)
+            if pending:
+                export_jobs[stem_print] = (stem_path, pending)
+
+        # A mix group is looked up in the cache by the prints it is summed from, so it is only rendered
+        # when one of them has changed or some of its files are missing
+        group_hashes, group_outputs = {}, {}
+        for name, stems in (mix_groups or {}).items():
+            outputs = get_output_paths(os.path.join(stems_dir, name), output_profiles)
+            stem_paths = [index[stem] for stem in stems if index.get(stem)]
+            if bounce_cache and stem_paths:
+                group_hashes[name] = bounce_cache.mix_group_hash(stem_paths)
+                outputs = reuse_outputs(name, None, outputs, source_hash=group_hashes[name])
+            if outputs:
+                group_outputs[name] = outputs
+
+        # Each stem is recorded and saved as soon as it has been exported, so a bounce that is killed partway
+        # through never has to encode the stems that had already finished
+        def record_export(stem_print):
+            stem_path, outputs = export_jobs[stem_print]
+            for output_path, profile in outputs:
+                # Newly encoded stems are deduplicated against every previous version in the object store,
+                # a copied print has the same sha256 as the print so the cache saves reading it again
+                if object_store:
+                    copied = bounce_cache and profile.format in COPY_FORMATS
+                    object_store.add(output_path, bounce_cache.content_hash(stem_path) if copied else None)
+                if bounce_cache:
+                    bounce_cache.record(stem_path, output_path, profile, source_hash=group_hashes.get(stem_print))
+            if bounce_cache:
+                bounce_cache.save()
+            if journal:
+                journal.record_exports(stem_path, [output_path for output_path, _ in outputs])
+            if package:
+                add_to_package([output_path for output_path, _ in outputs])
+
+        # Helper function to export the queued jobs into this STEMS directory in parallel
+        def export_jobs_parallel(jobs: dict) -> dict:
+            # The cache already holds the sha256 of every print it looked up, which the lossless copies are checked against
+            source_digests = {stem_print: bounce_cache.content_hash(stem_path)
+                              for stem_print, (stem_path, outputs) in jobs.items()
+                              if bounce_cache and any(profile.format in COPY_FORMATS for _, profile in outputs)}
+            return export_stems_parallel(jobs, workers=export_workers, streaming=streaming_export,
+                                         report=report, encoder_backend=encoder_backend, on_export=record_export,
+                                         source_digests=source_digests)
+
+        # The stems are exported first while the mix groups are rendered on a background thread,
+        # then the renders are exported like any other print
+        renders = run_in_background(render_mix_groups, {name: mix_groups[name] for name in group_outputs}, index,
+                                    stems_dir, name="bouncer-mix-groups") if group_outputs else None
+        render_paths = {}
+        try:
+            results = export_jobs_parallel(dict(export_jobs))
+            if renders:
+                render_paths = renders.result()
+                group_jobs = {name: (render_path, group_outputs[name]) for name, render_path in render_paths.items()}
+                export_jobs.update(group_jobs)
+                results.update(export_jobs_parallel(group_jobs))
+            return results
+        finally:
+            if renders and not render_paths:
+                render_paths = renders.result() # The stems failed, the renders are still removed once they are written
+            # The renders are only needed until they are exported, their encoded files stay in the cache
+            for render_path in render_paths.values():
+                os.remove(render_path)
+                if bounce_cache:
+                    bounce_cache.forget(render_path)
+
+    # perform the collect stems function on a single background thread, the exports themselves still use a process pool
+    return run_in_background(collect_stems, parent_dir=post_dir, directory=directory, StemType=stem_types,
+                             name="bouncer-stems")
+
+# Helper function that waits for the stems of the POST entry and copies the release note into it
+def finish_POST(source_dir, release_note_filepath, config: ProjectConfig, stems_future, package: PostPackage = None):
+    """
+    Blocks until the stem exports started by start_POST have finished, then copies the release note into the POST entry
+    and finishes the package, which is left out if any stem failed to export so an incomplete archive is never sent.
+    Returns {stem name: None or the error it failed to export with}, any error raised while collecting the stems is raised here.
+    """
+    import shutil
+    results = stems_future.result()
+    post_dir = get_post_entry_dir(source_dir, config)
 
     # Copy the release note into the POST entry
-    release_note_filename = f"Release Notes v{Config['Metadata']['Version']} {Config['Metadata']['Current Date of Version']}"
+    release_note_filename = f"Release Notes v{config.version} {config.current_date}"
     post_release_note_filepath = os.path.join(post_dir, release_note_filename)
     print(f"\nCopied {release_note_filename} into POST folder")
-    shutil.copy2(release_note_filepath, post_release_note_filepath)
-
-    print(f"POST entry for v{Config['Metadata']['Version']} dated {Config['Metadata']['Current Date of Version']} has been created")
-
+    shutil.copy2(release_note_filepath, get_part_path(post_release_note_filepath))
+    os.replace(get_part_path(post_release_note_filepath), post_release_note_filepath)
+
+    print(f"POST entry for v{config.version} dated {config.current_date} has been created")
+    if package:
+        if any(error is not None for error in results.values()):
+            package.discard()
+            print("Not every stem was exported, so the POST entry wasn't packaged")
+        else:
+            print(f"Packaged the POST entry into {os.path.basename(package.close())}")
+    return results
 
-def create_default_config(config_path, source_dir_path):
+# Helper function that creates a POST directory to store the version based deliverables folders that will be sent to clients
+def generate_POST(source_dir, directory, release_note_filepath,
+                  config: ProjectConfig, stem_types: StemTypes = StemTypes,
+                  consolidate_sel: bool = True, alp_dir_flag: bool = False,
+                  export_workers: int = 0, streaming_export: bool = True,
+                  stems_index: dict = None, bounce_cache: BounceCache = None,
+                  report: BounceReport = None, output_profiles: list = DEFAULT_OUTPUT_PROFILES,
+                  object_store: ObjectStore = None, journal: BounceJournal = None,
+                  encoder_backend: str = "ffmpeg", mix_groups: dict = None):
+    """Creates the POST entry, collects the stems into it and copies the release note over, waiting for every step."""
+    package = PostPackage(get_post_entry_dir(source_dir, config)) if config.package_post else None
+    stems_future = start_POST(source_dir, directory, config, stem_types,
+                              consolidate_sel=consolidate_sel, alp_dir_flag=alp_dir_flag,
+                              export_workers=export_workers, streaming_export=streaming_export,
+                              stems_index=stems_index, bounce_cache=bounce_cache, report=report,
+                              output_profiles=output_profiles, object_store=object_store, journal=journal,
+                              encoder_backend=encoder_backend, package=package, mix_groups=mix_groups)
+    return finish_POST(source_dir, release_note_filepath, config, stems_future, package)
+
+
+def create_default_config(config_path, source_dir_path, interactive: bool = True):
+    config = ProjectConfig.from_defaults(config_path)
     # check default_useSourceDirName
     if DEFAULT_useSourceDirName:
         # If default_useSourceDirName is true then run parse_sourceDirNam
-        parse_sourceDirName_flag = parse_sourceDirName(source_dir_path)
-        increment_version(source_dir_path)
+        parse_sourceDirName_flag = parse_sourceDirName(source_dir_path, config, interactive)
+        increment_version(config)
         if not parse_sourceDirName_flag:
-            createSongID(source_dir_path,genre_abbreviation= ' ')
+            createSongID(source_dir_path, config, genre_abbreviation= ' ')
+        config.save()
         print(
             f"config.ini file has been created at {config_path}.\n Please fill out the rest of the file and rerun the script.")
-        return
-    # prompt user to select showcaseDir
-    new_showcase_dir = select_directory('Showcase')
-
-    # Create the defualt config.ini file with all values (except ones above) defaulted to blank
-    config = configparser.ConfigParser()
-    for section, options in DEFAULT_CONFIG_MODEL.items():
-        config.add_section(section)
-        for key, value in options.items():
-            config.set(section, key, str(value))
-
-    # Set the default showcase directory to the user selected one
-    config.set("Directories", "showcaseDir", str(new_showcase_dir))
-    # Change
-    with open(config_path, 'w') as configfile:
-        config.write(configfile)
+        return config
+    # prompt user to select showcaseDir and set it as the default showcase directory
+    config.showcase_dir = select_directory('Showcase', interactive)
+    config.save()
     print(f"Default config.ini file has been created at {config_path}.\n Please fill out the rest of the file and rerun the script.")
-    return
-def add_missing_keys(config, defaults, config_path):
-    """Add missing keys to the config file based on the defaults."""
-    missing_values = False
+    return config
+
+def add_missing_keys(config: ProjectConfig, defaults: dict = DEFAULT_CONFIG_MODEL, read_only: bool = False) -> list:
+    """
+    Add missing keys to the config based on the defaults, or with read_only only report them.
+    Returns a list of (section, key, default value) for every key that was missing.
+    """
+    added_keys = []
     for section, keys in defaults.items():
-        if section not in config:
-            config.add_section(section)
-            missing_values = True
         for key, value in keys.items():
-            if key not in config[section]:
-                #config[section][key] = value
-                config.set(section, key, value)
-                missing_values = True
-
-
-    if missing_values:
-        with open(config_path, 'w') as configfile:
-            config.write(configfile)
+            if not config.parser.has_option(section, key):
+                if not read_only:
+                    config.set(section, key, value)
+                added_keys.append((section, key, value))
+
+    if added_keys and read_only:
+        for section, key, value in added_keys:
+            print(f"The configuration entry '{key}' is missing from section '[{section}]'"
+                  + (f", it defaults to '{value}'." if value else "."))
+    elif added_keys:
         print("Missing keys were added to config.ini. Please fill out the empty ones.")
 
-    return missing_values
-
-def check_config(config_path, defaults: dict = DEFAULT_CONFIG_MODEL):
-    """Check if config file exists, create it if not, and prompt user to fill it out."""
-    if not os.path.exists(config_path):
-        create_default_config(config_path)
-        return False  # Config file created, but needs user input
-
-    # Load config and add missing keys if any
-    config = configparser.ConfigParser()
-    config.read(config_path)
-
-    #if add_missing_keys(config, defaults, config_path):
-    #    return False  # Missing keys were added, user needs to fill them out
+    return added_keys
 
+def check_config(config: ProjectConfig, defaults: dict = DEFAULT_CONFIG_MODEL, read_only: bool = False):
+    """
+    Validate the config against the defaults once, adding any missing keys, and prompt the user to fill out empty values.
+    With read_only the missing keys are only reported, for --check-config which never changes the config.ini.
+    Returns False if the config.ini needs user input before the bouncer can run.
+    """
     # Check for empty values
     missing_values = False
-    for section in config.sections():
-        for key in config[section]:
-            if not config[section][key] and (not section == "Directories"):
+    for section in config.parser.sections():
+        for key in config.parser[section]:
+            if not config.parser[section][key] and (not section == "Directories"):
                 print(f"The configuration entry '{key}' in section '[{section}]' is empty. Please fill it out.")
                 missing_values = True
-    missing_fields = add_missing_keys(config, defaults, config_path)
+    # Keys added with a default value don't need the user to fill them out
+    missing_fields = [key for section, key, value in add_missing_keys(config, defaults, read_only)
+                      if not value and section != "Directories"]
     if missing_values or missing_fields:
         print("Please update the config.ini file with the required values and rerun the script.")
         return False  # Config file needs user input
 
     return True  # Config file is ready to use
 
-def main(source_dir: str = SOURCE_DIR):
+def main(source_dir: str = SOURCE_DIR, interactive: bool = True, export_workers: int = None,
+         option_overrides: dict = None, comments: str = None, profile: bool = False):
+    """
+    Runs the bouncer process for a single project directory.
+    Setting interactive to False never opens a dialog or waits for input, and export_workers overrides the exportWorkers option.
+    option_overrides maps [Options] keys to values used for this run only, and comments replaces the release comments dialog.
+    Setting profile to True runs the bounce under cProfile and saves the stats next to the release note.
+    Returns True if a new version was bounced, False if the config.ini needs to be filled out first.
+    Stops with SystemExit like any other failed bounce if a stem failed to export, in which case the version isn't
+    incremented and the journal is kept so a rerun retries the failed stems.
+    """
     if not os.path.exists(source_dir):
         print("The source directory doesn't exist")
         raise SystemExit(1)
@@ -568,17 +2715,17 @@ def main(source_dir: str = SOURCE_DIR):
     ini_filepath = os.path.join(source_dir, CONFIGFILE_NAME)
     if not os.path.exists(ini_filepath):
         # If it doesn't then run create_default_config()
-        create_default_config(ini_filepath, source_dir_path=source_dir)
-        return
+        create_default_config(ini_filepath, source_dir_path=source_dir, interactive=interactive)
+        return False
 
-    # Use the config file, check if useSourceDirName is used and check if the abletonAsDAW flag is asserted high
-    config = configparser.ConfigParser()
-    ini_filepath = os.path.join(source_dir, CONFIGFILE_NAME)
-    config.read_file(open(ini_filepath))
+    # Load the config file once, check if useSourceDirName is used and check if the abletonAsDAW flag is asserted high
+    config = ProjectConfig.load(ini_filepath)
+    for option, value in (option_overrides or {}).items():
+        config.override("Options", option, value)
 
     # Set the Source Directory global variable to be the directory set in the config.ini
-    if os.path.isdir(config["Directories"]["sourceDir"]):
-        source_dir = config["Directories"]["sourceDir"]
+    if os.path.isdir(config.source_dir):
+        source_dir = config.source_dir
     else:
         print("The path entered into the sourcedir field in the config.ini is not a valid path type, please enter a correct one if you wish to set the source directory")
         print("Make sure that there are no quotation marks around the directory location, e.g. \"path\\to\\sourceDir\" ")
@@ -586,102 +2733,763 @@ def main(source_dir: str = SOURCE_DIR):
     # Run the final checks before proceeding with the main algorithm
 
     print("Checking that all fields are in config.ini")
-    if not check_config(ini_filepath):
-        return
+    if not check_config(config):
+        config.save()
+        return False
 
-    if config["Options"].getboolean("useSourceDirNames"):
-        if add_missing_keys(config, defaults=DEFAULT_CONFIG_MODEL, config_path=ini_filepath):
-            parse_sourceDirName_flag = parse_sourceDirName(source_dir)
-            increment_version(source_dir)
+    if config.use_source_dir_names:
+        if add_missing_keys(config):
+            parse_sourceDirName_flag = parse_sourceDirName(source_dir, config, interactive)
+            increment_version(config)
             if not parse_sourceDirName_flag:
-                createSongID(source_dir, genre_abbreviation=' ')
+                createSongID(source_dir, config, genre_abbreviation=' ')
+            config.save()
             print(
-                f"config.ini file has been edited at {config_path}.\n Please fill out the rest of the file and rerun the script.")
-            return
+                f"config.ini file has been edited at {ini_filepath}.\n Please fill out the rest of the file and rerun the script.")
+            return False
 
-    if config["Options"].getboolean("abletonAsDAW"):
+    if config.ableton_as_daw:
         # If it is then check if the ALP_Dir does not exist or it is not valid
-        if not os.path.isdir(config["Directories"]["alpDir"]) :
+        if not os.path.isdir(config.alp_dir) :
             # If this condition is satisfied then prompt user to select ALP_DIR
-            new_alp_dir = select_directory()
-            config.set("Directories", "alpDir", str(new_alp_dir))
-        config.set("Directories", "stemsDir", 'N/A')
+            config.alp_dir = select_directory(interactive=interactive)
+        config.stems_dir = 'N/A'
         # If it isnt asserted high, then prompt user to select Stems_Dir
     else:
         # If it isnt asserted high then create a stems_dir entry in config.ini and make alp_dir blank
-        if not os.path.isdir(config["Directories"]["stemsDir"]):
+        if not os.path.isdir(config.stems_dir):
             # If this condition is satisfied then prompt user to select stems_DIR
-            new_stems_dir = select_directory('Stems')
-            config.set("Directories", "stemsDir", str(new_stems_dir))
-        config.set("Directories", "alpDir", 'N/A')
+            config.stems_dir = select_directory('Stems', interactive)
+        config.alp_dir = 'N/A'
 
-    if not os.path.isdir(config["Directories"]["showcaseDir"]):
+    if not os.path.isdir(config.showcase_dir):
         # If this condition is satisfied then prompt user to select stems_DIR
-        new_showcase_dir = select_directory('Showcase')
-        config.set("Directories", "showcaseDir", str(new_showcase_dir))
-    config.set("Directories", "sourceDir", source_dir)
+        config.showcase_dir = select_directory('Showcase', interactive)
+    config.source_dir = source_dir
 
 
     ##### The MAIN ALGORITHM ######
-    alp_dir: str = config["Directories"]["alpDir"]
-    stems_dir: str = config["Directories"]["stemsDir"]
-    source_dir: str = config["Directories"]["sourceDir"]
-    showcase_dir: str = config["Directories"]["showcaseDir"]
-    version: str = config["Metadata"]["version"]
-
-    save_master_editions_flag: bool = config["Options"].getboolean("saveMasterEditions")
-    ableton_as_daw_flag: bool = config["Options"].getboolean("abletonAsDAW")
+    source_dir: str = config.source_dir
+    showcase_dir: str = config.showcase_dir
+    version: int = config.version
+
+    save_master_editions_flag: bool = config.save_master_editions
+    ableton_as_daw_flag: bool = config.ableton_as_daw
     # The abletonConsolidateFlag is used to choose whether to get the stems from the recorded folder or the consolidate folder
-    ableton_consolidate_sel_flag: bool = config["Options"].getboolean("abletonConsolidateFlag")
+    ableton_consolidate_sel_flag: bool = config.ableton_consolidate
 
     # The custom comment flag is used to choose whether to leave the comments section in the release note blank or fill it out using the terminal UI
-    custom_comment_flag: bool = config["Options"].getboolean("customComment")
-
-    song_id = config["Metadata"]["songID"]
-    current_date_of_version = config["Metadata"]["Current Date of Version"]
-    artist = config["Song Details"]["artist"]
-    song_name = config["Song Details"]["song name"]
-    bpm = config["Song Details"]["bpm"]
-    key = config["Song Details"]["key"]
-    time_signature = config["Song Details"]["time signature"]
-    duration = config["Song Details"]["duration"]
-    genre_abbreviation = config["Song Details"]["genre abbreviation"]
-
-    # A simple Helper function to make sure that
-    def timeSignatureNot4_4(time_signature):
-        return True if not (time_signature == "4/4") else False
-
-    phasesCount: int = 1 # For the CLI to count each phase of the bouncer process
-
-    print(f"\nPhase {phasesCount}: Copy Latest Master Track to Showcase Directory")
-    phasesCount += 1
-    directory = alp_dir if ableton_as_daw_flag else stems_dir
-    master_track = get_latest_stems_print(directory,
-                                          stems_print="MASTER PRINT",
-                                          consolidate_sel=ableton_consolidate_sel_flag,
-                                          alp_dir_flag=ableton_as_daw_flag)
-    copy_Master_to_ShowcaseDir(master_track, showcase_dir, source_dir,
-                               song_id, version, artist, song_name, bpm, key, time_signature,
-                               non_standard_time_signature_flag=timeSignatureNot4_4(time_signature),
-                               save_master_editions_flag=save_master_editions_flag)
-
-    print(f"\nPhase {phasesCount}: Creating a release note for v{version} {current_date_of_version}")
-    phasesCount += 1
-    release_note_filepath = create_release_note(source_dir, config_filename=CONFIGFILE_NAME,
-                                                non_standard_time_signature=timeSignatureNot4_4(time_signature),
-                                                custom_comments_flag=custom_comment_flag)
-
-    print(f"\nPhase {phasesCount}: Create a new post entry in the POST directory and copy over the stems and release note into this entry")
-    phasesCount += 1
-    generate_POST(source_dir, alp_dir, release_note_filepath,
-                  config_filename=CONFIGFILE_NAME,
-                  consolidate_sel= ableton_consolidate_sel_flag,
-                  alp_dir_flag= ableton_as_daw_flag,
-                  stem_types=StemTypes)
-    # Add one to the version number and save it to config file
-    increment_version(source_dir)
-    return
+    custom_comment_flag: bool = config.custom_comment
+
+    # The export workers count sets how many stems are encoded in parallel, 0 uses every CPU core
+    if export_workers is None:
+        export_workers = config.export_workers
+    # The streaming export flag pipes the prints to the encoder in chunks instead of decoding them into memory
+    streaming_export_flag: bool = config.streaming_export
+    # Any extra stem print prefixes to collect on top of the StemTypes
+    stem_prefixes: list = get_stem_prefixes(config.extra_stem_prints)
+    # The incremental cache flag reuses the mp3s of prints that haven't changed since the previous version
+    bounce_cache = BounceCache(source_dir) if config.incremental_cache else None
+    # The object store keeps one copy of each unique stem file that every POST entry links to
+    object_store = ObjectStore(source_dir) if config.object_store else None
+    # The release catalog indexes every version of every project that shares it, see ReleaseCatalog
+    catalog = None
+    if config.release_catalog:
+        import sqlite3
+        try:
+            catalog = ReleaseCatalog(get_catalog_path(source_dir, config))
+        except sqlite3.Error as error:
+            print(f"Could not open the release catalog, this version won't be added to it: {error}")
+    # The catalog is closed and the profile saved however the bounce ends, including a stop_bouncer, a failed stem
+    # or an early return
+    profiler = None
+    try:
+        # The output profiles list every format the prints are delivered in, each print is decoded once for all of them
+        # The encoder backend picks between ffmpeg processes and encoding the mp3s in process with LAME
+        try:
+            output_profiles: list = parse_output_profiles(config.output_profiles)
+            encoder_backend: str = get_encoder_backend(config.encoder_backend)
+            # Stems with no window louder than the silence threshold are left out of the POST entry, None exports every stem
+            silence_threshold = parse_silence_threshold(config.silence_threshold)
+            # Mix groups are extra deliverables summed from the stem prints, e.g. an instrumental without the vocals
+            mix_groups: dict = parse_mix_groups(config.mix_groups, stem_prefixes)
+        except ValueError as error:
+            print(f"{error}. Stopping Bouncer process \n")
+            stop_bouncer(interactive)
+
+        song_id = config.song_id
+        current_date_of_version = config.current_date
+        artist = config.artist
+        song_name = config.song_name
+        bpm = config.bpm
+        key = config.key
+        time_signature = config.time_signature
+
+        # A simple Helper function to make sure that
+        def timeSignatureNot4_4(time_signature):
+            return True if not (time_signature == "4/4") else False
+
+        phasesCount: int = 1 # For the CLI to count each phase of the bouncer process
+        # The report times every phase and export, the profiler is only used when asked for as it slows the run down
+        report = BounceReport()
+        # The timing report (and profile) of this version are saved next to its release note
+        report_basename = os.path.splitext(get_release_note_path(source_dir, config))[0].replace("Release Notes",
+                                                                                                 "Bounce Report", 1)
+        if profile:
+            import cProfile
+            report.profile_path = report_basename + ".prof"
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        print(f"\nPhase {phasesCount}: Copy Latest Master Track to Showcase Directory")
+        phasesCount += 1
+        directory = config.prints_directory
+        # Index the latest print of every stem once, all later lookups are taken from this index
+        with report.phase("Index stem prints"):
+            stems_index = build_stems_index(directory, stem_prefixes,
+                                            consolidate_sel=ableton_consolidate_sel_flag,
+                                            alp_dir_flag=ableton_as_daw_flag)
+        master_track = get_latest_stems_print(directory,
+                                              stems_print="MASTER PRINT",
+                                              consolidate_sel=ableton_consolidate_sel_flag,
+                                              alp_dir_flag=ableton_as_daw_flag,
+                                              stems_index=stems_index)
+        if master_track is None:
+            print("\nCould not find a MASTER PRINT to copy to the Showcase Directory. Stopping Bouncer process \n")
+            stop_bouncer(interactive)
+        # Read the length and format of the master from its header, these go into the config.ini and the release note
+        try:
+            master_info = probe_wav(master_track)
+            config.duration = f"{master_info.duration:.3f}"
+            config.sample_rate = master_info.sample_rate
+            config.bit_depth = f"{master_info.bit_depth}{' float' if master_info.format_tag == WAVE_FORMAT_IEEE_FLOAT else ''}"
+            config.channels = master_info.channels
+        except (OSError, ValueError, struct.error) as error:
+            print(f"Could not read the format of {os.path.basename(master_track)}: {error}")
+
+        # Pick up where an interrupted bounce of this version stopped, the phases it finished are skipped
+        journal = BounceJournal.resume(source_dir, version)
+        release_note_phase = journal.phase_done("release note")
+        if release_note_phase and not os.path.isfile(release_note_phase["path"]):
+            release_note_phase = None
+
+        # Silent stems are found before any encoder starts, they are skipped and listed in the release note instead.
+        # The master is always exported
+        silent_stems = []
+        if silence_threshold is not None:
+            with report.phase("Silent stem check"):
+                silent_stems = find_silent_stems({name: path for name, path in stems_index.items()
+                                                  if path and name != StemTypes.MASTER.value},
+                                                 silence_threshold, export_workers)
+        stems_index = {name: path for name, path in stems_index.items() if name not in silent_stems}
+
+        # The package and the background work are started inside the try, so a failure while starting them
+        # still discards the package and waits for whatever did start
+        package = stems_future = analysis_future = None
+        try:
+            # The deliverable archive of the POST entry is written alongside the exports when packagePOST is set
+            package = PostPackage(get_post_entry_dir(source_dir, config)) if config.package_post else None
+            # Start encoding the stems straight away, they are collected in the background while the master is copied
+            # and the release comments are typed, the POST entry is finished once the release note has been written
+            stems_future = start_POST(source_dir, directory,
+                                      config,
+                                      consolidate_sel= ableton_consolidate_sel_flag,
+                                      alp_dir_flag= ableton_as_daw_flag,
+                                      stem_types=StemTypes,
+                                      export_workers=export_workers,
+                                      streaming_export=streaming_export_flag,
+                                      stems_index=stems_index,
+                                      bounce_cache=bounce_cache,
+                                      report=report,
+                                      output_profiles=output_profiles,
+                                      object_store=object_store,
+                                      journal=journal,
+                                      encoder_backend=encoder_backend,
+                                      package=package,
+                                      mix_groups=mix_groups)
+            # The prints are analysed in the background too, the results are needed once the release note is written.
+            # A resumed bounce whose release note is already written still analyses them for the POST entry's json
+            analysis_path = os.path.join(get_post_entry_dir(source_dir, config),
+                                         f"Audio Analysis v{version} {current_date_of_version}.json")
+            analysis_phase = journal.phase_done("audio analysis")
+            if config.audio_analysis and not (analysis_phase and os.path.isfile(analysis_path)):
+                analysis_future = run_in_background(analyse_prints, {name: path for name, path in stems_index.items() if path},
+                                                    export_workers, name="bouncer-analysis")
+            with report.phase("Copy master to showcase"):
+                if journal.phase_done("showcase master", master_track):
+                    print(f"The master of v{version} was already copied to the showcase directory before the last bounce stopped")
+                else:
+                    copy_Master_to_ShowcaseDir(master_track, showcase_dir, source_dir,
+                                               song_id, version, artist, song_name, bpm, key, time_signature,
+                                               non_standard_time_signature_flag=timeSignatureNot4_4(time_signature),
+                                               save_master_editions_flag=save_master_editions_flag,
+                                               streaming_export_flag=streaming_export_flag,
+                                               bounce_cache=bounce_cache,
+                                               interactive=interactive,
+                                               report=report,
+                                               output_profiles=output_profiles,
+                                               waveform_peaks_flag=config.waveform_peaks,
+                                               encoder_backend=encoder_backend)
+                    journal.complete_phase("showcase master", master_track)
+
+            print(f"\nPhase {phasesCount}: Creating a release note for v{version} {current_date_of_version}")
+            phasesCount += 1
+            with report.phase("Release note"):
+                if release_note_phase:
+                    # The comments were already typed into this release note, so the dialog isn't opened again
+                    release_note_filepath = release_note_phase["path"]
+                    print(f"{os.path.basename(release_note_filepath)} was already written before the last bounce stopped")
+                else:
+                    release_note_filepath = create_release_note(source_dir, config,
+                                                                non_standard_time_signature=timeSignatureNot4_4(time_signature),
+                                                                custom_comments_flag=custom_comment_flag,
+                                                                interactive=interactive,
+                                                                comments=comments,
+                                                                report=report,
+                                                                analysis_future=analysis_future,
+                                                                catalog=catalog,
+                                                                silent_stems=silent_stems)
+            # Save the full audio analysis into the POST entry alongside the stems
+            if analysis_future is not None and analysis_future.result():
+                atomic_write_text(analysis_path, json.dumps(analysis_future.result(), indent=2))
+                journal.complete_phase("audio analysis", path=analysis_path)
+                print(f"Audio analysis saved to {os.path.basename(analysis_path)}")
+            elif analysis_future is None and analysis_phase and config.audio_analysis:
+                print(f"{os.path.basename(analysis_path)} was already written before the last bounce stopped")
+            if not release_note_phase:
+                journal.complete_phase("release note", path=release_note_filepath)
+
+            print(f"\nPhase {phasesCount}: Create a new post entry in the POST directory and copy over the stems and release note into this entry")
+            phasesCount += 1
+            # Only the time spent waiting on the background stem exports is counted here
+            with report.phase("Generate POST entry"):
+                stem_results = finish_POST(source_dir, release_note_filepath, config, stems_future, package)
+                if object_store:
+                    pruned_objects = object_store.prune()
+                    if pruned_objects:
+                        print(f"Removed {pruned_objects} stored stems that are no longer in any POST entry")
+                if bounce_cache:
+                    bounce_cache.save()
+        except BaseException:
+            # Let the exports that are already running finish, so the journal holds them for the next run
+            print("Waiting for the background stem exports to finish before stopping")
+            for future in (stems_future, analysis_future):
+                if future is not None:
+                    future.exception()
+            if package:
+                package.discard()
+            raise
+
+        if config.timing_report:
+            report.write(report_basename + ".json", config)
+
+        failed_stems = [stem_print for stem_print, error in stem_results.items() if error is not None]
+        if failed_stems:
+            print(f"{', '.join(failed_stems)} failed to export, v{version} is left unfinished. "
+                  "Rerun the bouncer to retry them, the stems that did export are kept")
+            # The directories picked and the metadata read in this run are kept for the retry, only the version waits
+            config.save()
+            stop_bouncer(interactive)
+
+        # Add one to the version number and save every change to the config file in one write,
+        # the journal is only removed afterwards so a crash in between can never bounce the same version twice
+        increment_version(config, catalog=catalog)
+        config.save()
+        journal.clear()
+        return True
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            os.makedirs(os.path.dirname(report.profile_path), exist_ok=True) # Not there yet if the bounce stopped early
+            profiler.dump_stats(report.profile_path)
+            print(f"Profile saved to {os.path.basename(report.profile_path)}")
+        if catalog:
+            catalog.close()
+
+# Helper function to find every project directory under a projects root, i.e. the directories containing a config.ini
+def discover_projects(projects_root) -> list:
+    projects = []
+    for dir_path, dir_names, file_names in os.walk(projects_root):
+        if CONFIGFILE_NAME in file_names:
+            projects.append(dir_path)
+            dir_names[:] = [] # A project's own sub folders never hold other projects
+        else:
+            dir_names[:] = sorted(name for name in dir_names if not name.startswith("."))
+    return projects
+
+# Helper function to read the song details back out of a release note written by create_release_note
+def parse_release_note(release_note_path) -> dict:
+    """Returns {label: value} of every 'Label: value' line before the comments, e.g. {'BPM': '128', ...}."""
+    details = {}
+    with open(release_note_path) as release_note:
+        for line in release_note:
+            label, separator, value = line.partition(":")
+            if label == "Comments":
+                break
+            if separator:
+                details[label.strip()] = value.strip()
+    return details
+
+# Rebuild the release catalogs of every project under a projects root from their release notes and folders
+def rebuild_catalog(projects_root) -> dict:
+    """
+    Every project is written to its own catalog (see get_catalog_path), after the rows of the projects under
+    projects_root have been removed from it, so versions whose folders are gone drop out of the catalog.
+    Returns a dictionary mapping each catalog path to the number of versions written to it.
+    """
+    if not os.path.isdir(projects_root):
+        print(f"The projects root {projects_root} doesn't exist")
+        raise SystemExit(1)
+    projects_root = os.path.abspath(projects_root)
+    catalog_rows = {}
+    for project_dir in discover_projects(projects_root):
+        project_dir = os.path.abspath(project_dir)
+        try:
+            config = ProjectConfig.load(os.path.join(project_dir, CONFIGFILE_NAME))
+        except (OSError, configparser.Error) as error:
+            print(f"Skipping {project_dir}, its {CONFIGFILE_NAME} can't be read: {error}")
+            continue
+        rows = catalog_rows.setdefault(get_catalog_path(project_dir, config), [])
+
+        # Index the POST entries by version and date, their names hold the artist and song name of that version
+        post_dirs = {}
+        posts_dir = os.path.join(project_dir, "POST")
+        if os.path.isdir(posts_dir):
+            with os.scandir(posts_dir) as entries:
+                for entry in entries:
+                    match = re.search(r" v(\d+) (\S+)$", entry.name)
+                    if match and entry.is_dir() and not entry.name.startswith("."):
+                        post_dirs[(int(match[1]), match[2])] = entry.path
+
+        release_notes_dir = os.path.join(project_dir, "release_notes")
+        if not os.path.isdir(release_notes_dir):
+            continue
+        with os.scandir(release_notes_dir) as entries:
+            for entry in entries:
+                match = re.fullmatch(r"Release Notes v(\d+) (\S+)\.txt", entry.name)
+                if not match:
+                    continue
+                version, date = int(match[1]), match[2]
+                details = parse_release_note(entry.path)
+                rows.append({"project_dir": project_dir, "version": version, "song_id": config.song_id,
+                             "date": to_iso_date(details.get("Date of Version", date)),
+                             "artist": details.get("Artist"), "song_name": details.get("Song Name"),
+                             "bpm": to_number(details.get("BPM")), "key": details.get("Key Signature"),
+                             "time_signature": details.get("Time Signature", "4/4"),
+                             "duration": to_number(details.get("Song Duration in Seconds")),
+                             "sample_rate": to_number(details.get("Sample Rate in Hertz")),
+                             "showcase_path": find_showcase_master(config.showcase_dir, config.song_id, version),
+                             "post_dir": post_dirs.get((version, date)), "release_note_path": entry.path,
+                             # The version number in the config.ini only moves on once a bounce has finished
+                             "released": int(version < config.version)})
+
+    for catalog_path, rows in catalog_rows.items():
+        with ReleaseCatalog(catalog_path) as catalog:
+            with catalog.connection:
+                root_prefix = os.path.join(projects_root, "")
+                catalog.connection.execute("DELETE FROM versions WHERE project_dir = ? OR substr(project_dir, 1, ?) = ?",
+                                           (projects_root, len(root_prefix), root_prefix))
+            catalog.upsert(rows)
+        print(f"Wrote {len(rows)} versions to {catalog_path}")
+    return {catalog_path: len(rows) for catalog_path, rows in catalog_rows.items()}
+
+# Worker function run inside the batch process pool, so it has to live at module level to be picklable
+def bounce_project(project_dir, export_workers: int = 1, option_overrides: dict = None):
+    """
+    Runs main non interactively for one project, writing its output to bouncer.log in the project directory.
+    Returns a tuple of (status, duration in seconds, message) where status is 'bounced', 'skipped' or 'failed'.
+    """
+    start_time = time.perf_counter()
+    log_path = os.path.join(project_dir, "bouncer.log")
+    try:
+        with open(log_path, "w") as log_file, contextlib.redirect_stdout(log_file):
+            bounced = main(project_dir, interactive=False, export_workers=export_workers,
+                           option_overrides=option_overrides)
+        status, message = ("bounced", "") if bounced else ("skipped", f"not bounced, see {log_path}")
+    except SystemExit:
+        status, message = "failed", f"stopped, see {log_path}"
+    except Exception as error:
+        status, message = "failed", f"{type(error).__name__}: {error}"
+    return status, time.perf_counter() - start_time, message
+
+# Bounce every project under a projects root, a bounded number of projects at a time
+def batch_main(projects_root, workers: int = 0, export_workers: int = 1, option_overrides: dict = None):
+    """
+    Discovers every project under projects_root and bounces them without any prompts using a process pool.
+    A worker count of 0 bounces one project per CPU core at a time.
+    Prints a summary table and returns a dictionary mapping each project directory to its (status, duration, message).
+    """
+    if not os.path.isdir(projects_root):
+        print(f"The projects root {projects_root} doesn't exist")
+        raise SystemExit(1)
+    projects = discover_projects(projects_root)
+    print(f"Found {len(projects)} projects under {projects_root}")
+    results = {}
+    if projects:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        workers = workers if workers > 0 else (os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=min(workers, len(projects))) as pool:
+            futures = {pool.submit(bounce_project, project, export_workers, option_overrides): project
+                       for project in projects}
+            for future in as_completed(futures):
+                project = futures[future]
+                try:
+                    results[project] = future.result()
+                except Exception as error:
+                    results[project] = ("failed", 0.0, f"{type(error).__name__}: {error}")
+                print(f"{results[project][0]:<8} {os.path.relpath(project, projects_root)}")
+
+    # Print the summary table in the order the projects were found
+    name_width = max([len(os.path.relpath(project, projects_root)) for project in projects] + [7])
+    print(f"\n{'Project':<{name_width}}  {'Status':<8}  {'Duration':>9}  Message")
+    for project in projects:
+        status, duration, message = results[project]
+        print(f"{os.path.relpath(project, projects_root):<{name_width}}  {status:<8}  {duration:>8.1f}s  {message}")
+    counts = {status: sum(result[0] == status for result in results.values()) for status in ("bounced", "skipped", "failed")}
+    print(f"\n{counts['bounced']} bounced, {counts['skipped']} skipped, {counts['failed']} failed")
+    return {project: results[project] for project in projects}
+
+# Watches folders for new prints using the Linux inotify API, only the close and move events are needed
+class InotifyWatcher:
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    EVENT_HEADER = struct.Struct("iIII") # wd, mask, cookie, name length
+
+    def __init__(self, folders: list):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        import ctypes
+        import ctypes.util
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.folders = {}
+        for folder in folders:
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(folder), self.IN_CLOSE_WRITE | self.IN_MOVED_TO)
+            if wd < 0:
+                self.close()
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {folder}")
+            self.folders[wd] = folder
+
+    def wait(self, timeout: float) -> list:
+        """Returns the paths of the files written or moved into the watched folders within timeout seconds."""
+        import select
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, name_length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0")
+            offset += name_length
+            if wd in self.folders and name:
+                paths.append(os.path.join(self.folders[wd], os.fsdecode(name)))
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+# Watches folders for new prints by comparing the size and modification time of their files, works on every platform
+class PollingWatcher:
+    def __init__(self, folders: list):
+        self.folders = list(folders)
+        self.snapshot = self.scan()
+
+    def scan(self) -> dict:
+        snapshot = {}
+        for folder in self.folders:
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".wav") and entry.is_file():
+                            stat = entry.stat()
+                            snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+            except FileNotFoundError:
+                pass
+        return snapshot
+
+    def wait(self, timeout: float) -> list:
+        """Returns the paths of the files that were added or changed since the last call."""
+        time.sleep(timeout)
+        snapshot = self.scan()
+        changed = [path for path, signature in snapshot.items() if self.snapshot.get(path) != signature]
+        self.snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+# Helper function to get the folder that a project's prints are bounced into, from its config.ini
+def get_project_prints_folder(project_dir):
+    config = ProjectConfig.load(os.path.join(project_dir, CONFIGFILE_NAME))
+    folder = get_stems_folder(config.prints_directory, config.ableton_consolidate, config.ableton_as_daw)
+    return folder if os.path.isdir(folder) else None
+
+# Bounce a single new print of a project, only running the phase that the print affects
+def watch_bounce_print(project_dir, wav_path):
+    """
+    A new MASTER PRINT is copied to the showcase directory, any other stem print is exported into the
+    STEMS folder of the POST entry for the current version. Returns the stem print prefix that was bounced, or None
+    if the file isn't a stem print or the stem is silent, either of which is reported here.
+    """
+    config = ProjectConfig.load(os.path.join(project_dir, CONFIGFILE_NAME))
+    stem_prefixes = get_stem_prefixes(config.extra_stem_prints)
+    file_name = os.path.basename(wav_path)
+    stem_print = next((prefix for prefix in stem_prefixes if file_name.startswith(prefix)), None)
+    if stem_print is None:
+        print("Not a stem print, ignoring it")
+        return None
+
+    bounce_cache = BounceCache(project_dir) if config.incremental_cache else None
+    output_profiles = parse_output_profiles(config.output_profiles)
+    encoder_backend = get_encoder_backend(config.encoder_backend)
+    if stem_print == StemTypes.MASTER.value:
+        copy_Master_to_ShowcaseDir(wav_path, config.showcase_dir, project_dir,
+                                   config.song_id, config.version, config.artist, config.song_name,
+                                   config.bpm, config.key, config.time_signature,
+                                   non_standard_time_signature_flag=config.non_standard_time_signature,
+                                   save_master_editions_flag=config.save_master_editions,
+                                   streaming_export_flag=config.streaming_export,
+                                   bounce_cache=bounce_cache,
+                                   interactive=False,
+                                   output_profiles=output_profiles,
+                                   waveform_peaks_flag=config.waveform_peaks,
+                                   encoder_backend=encoder_backend)
+    else:
+        silence_threshold = parse_silence_threshold(config.silence_threshold)
+        # find_silent_stems says why a silent stem is left out
+        if silence_threshold is not None and find_silent_stems({stem_print: wav_path}, silence_threshold, workers=1):
+            return None
+        stems_dir = os.path.join(get_post_entry_dir(project_dir, config), "STEMS")
+        os.makedirs(stems_dir, exist_ok=True)
+        outputs = get_output_paths(os.path.join(stems_dir, stem_print), output_profiles)
+        _, pending = reuse_cached_outputs(wav_path, outputs, bounce_cache)
+        if pending:
+            export_stem(wav_path, pending, streaming=config.streaming_export, encoder_backend=encoder_backend,
+                        source_digest=bounce_cache.content_hash(wav_path) if bounce_cache else None)
+            if config.object_store:
+                object_store = ObjectStore(project_dir)
+                for output_path, _ in pending:
+                    object_store.add(output_path)
+        if bounce_cache:
+            for output_path, profile in outputs:
+                bounce_cache.record(wav_path, output_path, profile)
+        print(f"Exported {stem_print} into {os.path.relpath(stems_dir, project_dir)}")
+    if bounce_cache:
+        bounce_cache.save()
+    return stem_print
+
+# Watch the prints folders of one or more projects and bounce new prints as soon as they have been written
+def watch_main(paths: list, force_polling: bool = False,
+               debounce_seconds: float = WATCH_DEBOUNCE_SECONDS, poll_interval: float = WATCH_POLL_INTERVAL):
+    """
+    Each path is either a project directory or a projects root containing several projects.
+    Uses inotify where available and falls back to polling the folders. Runs until interrupted with Ctrl+C.
+    """
+    folders = {} # prints folder -> project directory
+    for path in paths:
+        for project_dir in discover_projects(path):
+            folder = get_project_prints_folder(project_dir)
+            if folder is None:
+                print(f"Skipping {project_dir}, its prints folder doesn't exist")
+                continue
+            folders[os.path.abspath(folder)] = project_dir
+    if not folders:
+        print("No project prints folders to watch")
+        raise SystemExit(1)
+
+    watcher = None
+    if not force_polling:
+        try:
+            watcher = InotifyWatcher(list(folders))
+        except (OSError, AttributeError) as error:
+            print(f"inotify is not available ({error}), polling the prints folders instead")
+    if watcher is None:
+        watcher = PollingWatcher(list(folders))
+    print(f"Watching {len(folders)} prints folders with {type(watcher).__name__}, press Ctrl+C to stop")
+
+    pending = {} # wav path -> (size, modification time, time the signature was last seen changing)
+    try:
+        while True:
+            for path in watcher.wait(poll_interval / 2 if pending else poll_interval):
+                if path.endswith(".wav"):
+                    pending[path] = (None, None, time.monotonic())
+
+            # A print is only bounced once its size and modification time have settled for the debounce period
+            now = time.monotonic()
+            for path, (size, modified_time, changed_at) in list(pending.items()):
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    del pending[path]
+                    continue
+                if (stat.st_size, stat.st_mtime_ns) != (size, modified_time):
+                    pending[path] = (stat.st_size, stat.st_mtime_ns, now)
+                elif now - changed_at >= debounce_seconds:
+                    del pending[path]
+                    project_dir = folders[os.path.dirname(os.path.abspath(path))]
+                    print(f"\nNew print in {os.path.basename(project_dir)}: {os.path.basename(path)}")
+                    try:
+                        watch_bounce_print(project_dir, path)
+                    except (Exception, SystemExit) as error:
+                        print(f"Failed to bounce {os.path.basename(path)}: {error}")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        watcher.close()
+
+# Exit codes of the command line interface
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_CONFIG_INCOMPLETE = 3
+
+# Helper function to turn an [Options] key such as saveMasterEditions into a command line flag such as --save-master-editions
+def option_to_flag(option: str) -> str:
+    return "--" + re.sub(r'(?<=[a-z])(?=[A-Z])', '-', option).lower()
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Bounce the latest Ableton prints of a project into the showcase and POST directories",
+        epilog=f"Exit codes: {EXIT_OK} bounced, {EXIT_FAILED} failed or a stem failed to export, "
+               f"{EXIT_CONFIG_INCOMPLETE} not bounced, the config.ini needs to be filled out")
+    parser.add_argument("source_dir", nargs="?", default=SOURCE_DIR,
+                        help="project directory to bounce (default: the parent directory of the script)")
+    parser.add_argument("--headless", action="store_true",
+                        help="never open a dialog or wait for input, stop with an error instead")
+    parser.add_argument("--profile", action="store_true",
+                        help="run the bounce under cProfile and save the stats next to the release note")
+    parser.add_argument("--check-config", action="store_true",
+                        help="only check that the project's config.ini is complete, without changing it")
+    comment_group = parser.add_mutually_exclusive_group()
+    comment_group.add_argument("--comment", metavar="TEXT",
+                               help="comments for the release note instead of the comments dialog")
+    comment_group.add_argument("--comment-file", metavar="PATH",
+                               help="read the comments for the release note from a text file")
+
+    # Every [Options] entry of the config.ini can be overridden for a single run
+    options_group = parser.add_argument_group("options", "override the [Options] section of config.ini for this run only")
+    for option, default in DEFAULT_CONFIG_MODEL['Options'].items():
+        if default in ("true", "false"):
+            options_group.add_argument(option_to_flag(option), dest=f"option_{option}", default=None,
+                                       action=argparse.BooleanOptionalAction, help=f"set {option}")
+        else:
+            options_group.add_argument(option_to_flag(option), dest=f"option_{option}", default=None,
+                                       type=int if default.isdigit() else str, metavar="VALUE", help=f"set {option}")
+
+    batch_group = parser.add_argument_group("batch and watch modes")
+    batch_group.add_argument("--batch", metavar="PROJECTS_ROOT",
+                             help="bounce every project (directory containing a config.ini) under PROJECTS_ROOT without any prompts")
+    batch_group.add_argument("--workers", type=int, default=0,
+                             help="number of projects bounced at the same time in batch mode, 0 uses one per CPU core")
+    batch_group.add_argument("--watch", metavar="PATH", nargs="+",
+                             help="watch the prints folders of the projects (or projects roots) and bounce new prints as they land")
+    batch_group.add_argument("--poll", action="store_true",
+                             help="poll the watched folders instead of using inotify")
+    batch_group.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE_SECONDS,
+                             help="seconds a new print must stay unchanged before it is bounced in watch mode")
+
+    catalog_group = parser.add_argument_group("release catalog")
+    catalog_group.add_argument("--rebuild-catalog", metavar="PROJECTS_ROOT",
+                               help="rebuild the release catalog from the release notes of every project under PROJECTS_ROOT")
+    catalog_group.add_argument("--find", metavar="FILTER", nargs="*",
+                               help="search the release catalog, e.g. --find bpm=128 'key=F minor' since=01-10-2026 "
+                                    f"(filters: {', '.join(ReleaseCatalog.FILTERS)})")
+    catalog_group.add_argument("--catalog", metavar="PATH",
+                               help="catalog searched by --find (default: the catalog of source_dir, "
+                                    f"or the {CATALOG_NAME} inside it when it isn't a project)")
+    return parser
+
+# Search the release catalog from the command line and print the matching versions
+def find_in_catalog(filters: list, catalog_path: str = None, source_dir: str = SOURCE_DIR) -> int:
+    if catalog_path is None:
+        ini_filepath = os.path.join(source_dir, CONFIGFILE_NAME)
+        catalog_path = (get_catalog_path(source_dir, ProjectConfig.load(ini_filepath)) if os.path.exists(ini_filepath)
+                        else os.path.join(source_dir, CATALOG_NAME))
+    if not os.path.exists(catalog_path):
+        print(f"No release catalog found at {catalog_path}, create it with --rebuild-catalog")
+        return EXIT_FAILED
+    catalog = ReleaseCatalog(catalog_path)
+    start_time = time.perf_counter()
+    try:
+        rows = catalog.find(**dict(entry.partition("=")[::2] for entry in filters))
+    except ValueError as error:
+        print(error)
+        return EXIT_FAILED
+    finally:
+        catalog.close()
+    query_ms = (time.perf_counter() - start_time) * 1000
+    for row in rows:
+        bpm = f"{row['bpm']:g}" if row["bpm"] is not None else "-"
+        print(f"{row['date'] or '-':<10}  {row['song_id'] or '-':<20} v{row['version']:<3} {bpm:>6} BPM  {row['key'] or '-':<10} "
+              f"{row['artist']} - {row['song_name']}{'' if row['released'] else ' (unfinished)'}\n"
+              f"            {row['showcase_path'] or row['post_dir'] or row['project_dir']}")
+    print(f"{len(rows)} versions found in {query_ms:.1f} ms")
+    return EXIT_OK
+
+def cli(argv: list = None) -> int:
+    """Runs the bouncer from the command line and returns the exit code."""
+    args = build_arg_parser().parse_args(argv)
+    # Only the on/off options are lowercased, the rest are passed on as typed (stem prefixes and names are case sensitive)
+    option_overrides = {}
+    for option in DEFAULT_CONFIG_MODEL['Options']:
+        value = getattr(args, f"option_{option}")
+        if value is not None:
+            option_overrides[option] = str(value).lower() if isinstance(value, bool) else str(value)
+
+    if args.check_config:
+        ini_filepath = os.path.join(args.source_dir, CONFIGFILE_NAME)
+        if not os.path.exists(ini_filepath):
+            print(f"No {CONFIGFILE_NAME} found in {args.source_dir}")
+            return EXIT_CONFIG_INCOMPLETE
+        config = ProjectConfig.load(ini_filepath)
+        if not check_config(config, read_only=True):
+            return EXIT_CONFIG_INCOMPLETE
+        print(f"{ini_filepath} is complete")
+        return EXIT_OK
+
+    if args.watch:
+        watch_main(args.watch, force_polling=args.poll, debounce_seconds=args.debounce)
+        return EXIT_OK
+
+    if args.rebuild_catalog:
+        rebuild_catalog(args.rebuild_catalog)
+        return EXIT_OK
+
+    if args.find is not None:
+        return find_in_catalog(args.find, args.catalog, args.source_dir)
+
+    if args.batch:
+        batch_results = batch_main(args.batch, workers=args.workers,
+                                   export_workers=int(option_overrides.pop("exportWorkers", 1)),
+                                   option_overrides=option_overrides)
+        return EXIT_FAILED if any(status == "failed" for status, _, _ in batch_results.values()) else EXIT_OK
+
+    comments = args.comment
+    if args.comment_file:
+        with open(args.comment_file) as comment_file:
+            comments = comment_file.read().strip()
+
+    interactive = not args.headless
+    try:
+        bounced = main(args.source_dir, interactive=interactive,
+                       option_overrides=option_overrides, comments=comments, profile=args.profile)
+    except SystemExit as error:
+        # The bouncer process was stopped, it has already told the user why
+        return error.code if isinstance(error.code, int) else EXIT_FAILED
+    if interactive:
+        EXIT = input("Press Enter to exit script")
+    return EXIT_OK if bounced else EXIT_CONFIG_INCOMPLETE
 
 if __name__ == "__main__":
-    main()
-    EXIT = input("Press Enter to exit script")
\ No newline at end of file
+    # Required for the export process pool to work in the frozen PyInstaller executables
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()
+    raise SystemExit(cli())
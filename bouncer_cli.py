@@ -0,0 +1,12 @@
+# Command line entry of the bouncer: python bouncer_cli.py [source_dir] [options], see --help
+# Kept to a few lines because Python compiles the script it runs on every start but caches the modules it imports,
+# so bouncer.py is imported from its cached bytecode instead of being compiled each time
+import sys
+
+if __name__ == "__main__":
+    # Required for the export process pool to work in the frozen PyInstaller executables
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()
+    from bouncer import cli
+    raise SystemExit(cli())
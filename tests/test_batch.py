@@ -0,0 +1,61 @@
+"""
+Tests for the batch mode of bouncer.py, run with: python -m unittest discover tests
+
+The projects are the synthetic ones from the benchmark suite. An encoder (ffmpeg or avconv) and pydub are needed
+to bounce them, the tests are skipped without them.
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, os.path.join(REPO_DIR, "benchmarks"))
+import bouncer
+import bench_bouncer
+
+# Options that need numpy are turned off, so only the encoder is needed
+BATCH_ARGS = ["--workers", "1", "--no-audio-analysis", "--no-waveform-peaks", "--silence-threshold", "none"]
+
+@unittest.skipUnless(bench_bouncer.encoder_available(), "pydub and ffmpeg are needed to bounce the projects")
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.projects_root = os.path.join(temp_dir.name, "projects")
+        showcase_dir = os.path.join(temp_dir.name, "showcase")
+        os.makedirs(showcase_dir)
+        self.good_project = bench_bouncer.make_project(self.projects_root, "Good", showcase_dir, takes=1, seconds=0.5)
+        self.broken_project = bench_bouncer.make_project(self.projects_root, "Broken", showcase_dir, takes=1, seconds=0.5)
+
+    def run_batch(self) -> tuple:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exit_code = bouncer.cli(["--batch", self.projects_root] + BATCH_ARGS)
+        return exit_code, output.getvalue()
+
+    def test_every_project_bounced(self):
+        exit_code, output = self.run_batch()
+        self.assertEqual(exit_code, bouncer.EXIT_OK, output)
+        self.assertIn("2 bounced, 0 skipped, 0 failed", output)
+
+    def test_failed_stem_export_fails_the_batch(self):
+        # A print that isn't a .wav file at all can't be exported, the rest of the project still is
+        drums_path = os.path.join(self.broken_project, bouncer.CONSOLIDATE_PATH, "DRUMS PRINT 0000.wav")
+        with open(drums_path, "wb") as drums_file:
+            drums_file.write(b"not a wav file")
+
+        exit_code, output = self.run_batch()
+        self.assertEqual(exit_code, bouncer.EXIT_FAILED, output)
+        self.assertIn("1 bounced, 0 skipped, 1 failed", output)
+        with open(os.path.join(self.broken_project, "bouncer.log")) as log_file:
+            self.assertIn("DRUMS PRINT failed to export", log_file.read())
+        # The failed version is retried by the next run instead of being skipped over
+        self.assertEqual(bouncer.ProjectConfig.load(os.path.join(self.broken_project, bouncer.CONFIGFILE_NAME)).version, 0)
+        self.assertEqual(bouncer.ProjectConfig.load(os.path.join(self.good_project, bouncer.CONFIGFILE_NAME)).version, 1)
+
+if __name__ == "__main__":
+    unittest.main()